@@ -15,13 +15,21 @@ tetrahedral coordination, fractal recursion).
 import os
 import sys
 import json
+import hashlib
+import ssl
 import asyncio
+import functools
 import aiohttp
+import orjson
 import time
-from datetime import datetime
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Deque, Dict, List, Mapping, Optional, Tuple, Any
 from enum import Enum
+from itertools import islice
+from pathlib import Path
+from types import MappingProxyType
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -32,27 +40,44 @@ logger.add(
     rotation="1 day", 
     retention="7 days", 
     level="INFO",
-    format="{time:YYYY-MM-DD HH:mm:ss} | {level} | 🌌 {message}"
+    format="{time:YYYY-MM-DD HH:mm:ss} | {level} | 🌌 {message}",
+    enqueue=True
 )
 logger.add(
-    lambda msg: print(msg, end=""), 
-    level="INFO", 
-    format="🌟 {time:HH:mm:ss} | {level} | {message}"
+    sys.stderr,
+    level="INFO",
+    format="🌟 {time:HH:mm:ss} | {level} | {message}",
+    enqueue=True
 )
 
 # Load environment variables
 load_dotenv()
 
+# Optional BPE tokenizer for token accounting; falls back to a word-count estimate
+try:
+    import tiktoken
+    _TOKENIZER = tiktoken.get_encoding("cl100k_base")
+except Exception:  # Not installed, or the encoding could not be loaded
+    _TOKENIZER = None
+
 # Configuration following geometric principles
 GOLDEN_RATIO = 1.618
 MAX_TOKENS = int(4096 * GOLDEN_RATIO)  # ~6627 tokens
 N_ROUNDS = 4  # Tetrahedral coordination (4 vertices)
 N_TURNS = int(2 * GOLDEN_RATIO)  # ~3.236, rounded to 3 turns per round
 FRACTAL_RECURSION_DEPTH = 3
+HISTORY_MAXLEN = 256  # Bounded conversation history for long-running sandloops
+GOLDEN_PAUSE = 1.0 / GOLDEN_RATIO  # ~0.618s reflection pause between turns
+ENABLE_GOLDEN_PAUSE = os.getenv("COSMIC_PAUSE", "0") == "1"
 
 # HO-Core API configuration
 HO_CORE_BASE_URL = os.getenv("HO_CORE_API_URL", "http://localhost:8080")
 HO_CORE_TIMEOUT = 60
+HO_CORE_HEALTH_TIMEOUT = 2.0  # Fail fast to the local fallback when ho-core is down
+
+# Response cache for repeated (provider, transcript, system prompt) requests
+RESPONSE_CACHE_SIZE = 256
+_response_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
 
 class LLMProvider(Enum):
     """LLM Providers matching ho-core's LLMProvider enum"""
@@ -70,7 +95,7 @@ class TetrahedralPosition(Enum):
     REFEREE = "Referee"
     DEVELOPMENT = "Development"
 
-@dataclass
+@dataclass(slots=True)
 class CosmicContext:
     """Context matching ho-core's CosmicContext structure"""
     task_id: str
@@ -83,7 +108,7 @@ class CosmicContext:
     previous_responses: List[Dict[str, Any]]
     cosmic_metadata: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SocraticMessage:
     """Message structure for Socratic dialogue"""
     role: str  # "advocate" or "skeptic" or "moderator"
@@ -92,29 +117,110 @@ class SocraticMessage:
     timestamp: datetime
     tokens_used: Optional[int] = None
     latency_ms: Optional[int] = None
-    geometric_metrics: Optional[Dict[str, Any]] = None
+    geometric_metrics: Optional[Mapping[str, Any]] = None
 
-class HoCoreClient:
-    """Client for interacting with ho-core API endpoints"""
+# Shared read-only metrics attached to every compliant message
+_GOLDEN_COMPLIANT_METRICS = MappingProxyType({"golden_ratio_compliance": True})
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for read-only mappings such as geometric_metrics"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class DialogueTranscript:
+    """
+    Per-round message transcript stored as parallel role/content lists.
     
-    def __init__(self, base_url: str = HO_CORE_BASE_URL):
-        self.base_url = base_url.rstrip('/')
-        self.session = None
+    Slots are preallocated for a full round, so turns are index writes rather
+    than per-message dict allocations. Chat-style message dicts are only
+    materialized via `as_messages()` where a provider API needs them.
+    """
+    __slots__ = ("roles", "contents", "size")
     
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=HO_CORE_TIMEOUT)
+    def __init__(self, capacity: int = 2 * N_TURNS + 1):
+        self.roles: List[Optional[str]] = [None] * capacity
+        self.contents: List[Optional[str]] = [None] * capacity
+        self.size = 0
+    
+    def append(self, role: str, content: str) -> None:
+        self.roles[self.size] = role
+        self.contents[self.size] = content
+        self.size += 1
+    
+    def as_messages(self) -> List[Dict[str, str]]:
+        return [
+            {"role": role, "content": content}
+            for role, content in zip(self.roles[:self.size], self.contents[:self.size])
+        ]
+
+# Mock provider replies until the real ho-core LLM routing is wired in
+_MOCK_RESPONSES = MappingProxyType({
+    LLMProvider.ANTHROPIC: "As an advocate for this thesis, I must emphasize the fundamental importance of the philosophical framework presented. The geometric principles underlying AI orchestration are not merely decorative but essential structural elements...",
+    LLMProvider.GROK: "But wait - isn't this just elaborate technobabble? How do we know that these 'geometric principles' aren't just marketing speak for existing distributed systems? Where's the empirical evidence?",
+    LLMProvider.KIMI_RESEARCH: "Synthesizing the dialogue: The thesis has merit in its structural approach to AI coordination, but requires more rigorous mathematical foundation. The integration of geometric principles with agent behavior presents both opportunities and challenges..."
+})
+
+def _response_cache_key(
+    provider: LLMProvider,
+    transcript: DialogueTranscript,
+    system_prompt: str
+) -> Tuple[str, str]:
+    """Build a compact cache key for a provider request"""
+    packed = json.dumps([transcript.roles[:transcript.size], transcript.contents[:transcript.size]])
+    digest = hashlib.blake2b(
+        (system_prompt + packed).encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+    return provider.value, digest
+
+@functools.lru_cache(maxsize=1024)
+def _count_tokens(text: str) -> int:
+    """Count tokens in a response, memoized for repeated responses"""
+    if _TOKENIZER is None:
+        return int(len(text.split()) * 1.3)  # Rough approximation
+    return len(_TOKENIZER.encode(text))
+
+@functools.lru_cache(maxsize=8)
+def _read_thesis_file(path: str, mtime_ns: int) -> str:
+    """Read a thesis file, cached until its modification time changes"""
+    return Path(path).read_text(encoding="utf-8").strip()
+
+# Process-wide connection pool for ho-core, created lazily on the running event loop
+_shared_connector: Optional[aiohttp.TCPConnector] = None
+
+def get_shared_connector() -> aiohttp.TCPConnector:
+    """Return the shared ho-core connector (DNS cache + keep-alive + TLS session reuse)"""
+    global _shared_connector
+    if _shared_connector is None or _shared_connector.closed:
+        _shared_connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=16,
+            keepalive_timeout=60,
+            ttl_dns_cache=600,
+            ssl=ssl.create_default_context(),
+            force_close=False
         )
-        return self
+    return _shared_connector
+
+async def close_shared_connector() -> None:
+    """Close the shared connector; call once before the process exits"""
+    global _shared_connector
+    if _shared_connector is not None:
+        await _shared_connector.close()
+        _shared_connector = None
+
+class HoCoreClient:
+    """Client for interacting with ho-core API endpoints"""
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+    def __init__(self, session: aiohttp.ClientSession, base_url: str = HO_CORE_BASE_URL):
+        self.base_url = base_url.rstrip('/')
+        self.session = session
     
     async def health_check(self) -> Dict[str, Any]:
         """Check ho-core node health"""
         async with self.session.get(f"{self.base_url}/health") as response:
-            return await response.json()
+            return orjson.loads(await response.read())
     
     async def generate_meta_prompts(
         self,
@@ -137,7 +243,7 @@ class HoCoreClient:
             f"{self.base_url}/python/meta-prompts",
             json=payload
         ) as response:
-            result = await response.json()
+            result = orjson.loads(await response.read())
             if result.get("success"):
                 return result.get("data", {})
             else:
@@ -160,7 +266,7 @@ class HoCoreClient:
             f"{self.base_url}/python/recursive-orchestration",
             json=payload
         ) as response:
-            result = await response.json()
+            result = orjson.loads(await response.read())
             if result.get("success"):
                 return result.get("data", {})
             else:
@@ -186,7 +292,7 @@ class HoCoreClient:
             f"{self.base_url}/python/fractal-agents",
             json=payload
         ) as response:
-            result = await response.json()
+            result = orjson.loads(await response.read())
             if result.get("success"):
                 return result.get("data", {})
             else:
@@ -215,10 +321,34 @@ class CosmicSocraticDialogue:
         self.skeptic_provider = skeptic_provider
         self.moderator_provider = moderator_provider
         
-        self.conversation_history: List[SocraticMessage] = []
+        # Per-role request bindings; only the transcript varies between turns
+        self._ask_skeptic = functools.partial(
+            self._get_provider_response,
+            provider=skeptic_provider,
+            system_prompt=self._get_skeptic_prompt(),
+            role="skeptic"
+        )
+        self._ask_advocate = functools.partial(
+            self._get_provider_response,
+            provider=advocate_provider,
+            system_prompt=self._get_advocate_prompt(),
+            role="advocate"
+        )
+        self._ask_moderator = functools.partial(
+            self._get_provider_response,
+            provider=moderator_provider,
+            system_prompt=self._get_moderator_prompt(),
+            role="moderator"
+        )
+        
+        self.conversation_history: Deque[SocraticMessage] = deque(maxlen=HISTORY_MAXLEN)
         self.current_thesis = ""
         self.geometric_metadata = {}
         
+        # Single wall-clock anchor; message timestamps are derived from the monotonic clock
+        self._run_started_at = datetime.now(timezone.utc)
+        self._run_anchor_ns = time.perf_counter_ns()
+        
         # Load initial thesis
         self._load_initial_thesis()
         
@@ -231,8 +361,10 @@ class CosmicSocraticDialogue:
     def _load_initial_thesis(self):
         """Load the initial thesis from file"""
         try:
-            with open(self.initial_thesis_file, 'r', encoding='utf-8') as f:
-                self.current_thesis = f.read().strip()
+            self.current_thesis = _read_thesis_file(
+                self.initial_thesis_file,
+                os.stat(self.initial_thesis_file).st_mtime_ns
+            )
             logger.info(f"📜 Loaded initial thesis from {self.initial_thesis_file}")
             logger.debug(f"Initial thesis: {self.current_thesis[:100]}...")
         except FileNotFoundError:
@@ -252,19 +384,30 @@ class CosmicSocraticDialogue:
         """
         logger.info("🚀 Starting Cosmic Socratic Dialogue execution")
         
-        async with HoCoreClient() as client:
+        session = aiohttp.ClientSession(
+            connector=get_shared_connector(),
+            connector_owner=False,
+            timeout=aiohttp.ClientTimeout(total=HO_CORE_TIMEOUT)
+        )
+        try:
+            client = HoCoreClient(session)
+            
             # Health check
             try:
-                health = await client.health_check()
+                health = await asyncio.wait_for(client.health_check(), timeout=HO_CORE_HEALTH_TIMEOUT)
                 logger.info(f"✅ Ho-core health: {health.get('status', 'unknown')}")
+            except asyncio.TimeoutError:
+                logger.warning(f"⚠️  Ho-core health check timed out after {HO_CORE_HEALTH_TIMEOUT}s")
+                logger.info("🔄 Continuing with local execution")
+                return await self._execute_local_dialogue()
             except Exception as e:
                 logger.warning(f"⚠️  Ho-core health check failed: {e}")
                 logger.info("🔄 Continuing with local execution")
                 return await self._execute_local_dialogue()
             
-            # Generate cosmic meta-prompts for dialogue enhancement
-            try:
-                meta_prompts = await client.generate_meta_prompts(
+            # Issue all setup requests together so they share the pooled keep-alive connections
+            meta_prompts, advocate_agent, skeptic_agent = await asyncio.gather(
+                client.generate_meta_prompts(
                     task_type="socratic_dialogue",
                     context={
                         "initial_thesis": self.current_thesis,
@@ -274,129 +417,96 @@ class CosmicSocraticDialogue:
                     },
                     recursion_depth=FRACTAL_RECURSION_DEPTH,
                     golden_ratio_scale=GOLDEN_RATIO
-                )
-                logger.info("✨ Generated cosmic meta-prompts for dialogue enhancement")
-                self.geometric_metadata.update({"meta_prompts": meta_prompts})
-            except Exception as e:
-                logger.warning(f"⚠️  Meta-prompt generation failed: {e}")
-            
-            # Create fractal agents for dialogue participants
-            try:
-                advocate_agent = await client.create_fractal_agents(
+                ),
+                client.create_fractal_agents(
                     agent_type="socratic_advocate",
                     base_capabilities=["philosophical_reasoning", "evidence_synthesis", "thesis_defense"],
                     tetrahedral_position=TetrahedralPosition.EXECUTOR.value
-                )
-                
-                skeptic_agent = await client.create_fractal_agents(
+                ),
+                client.create_fractal_agents(
                     agent_type="socratic_skeptic",
                     base_capabilities=["critical_analysis", "question_formulation", "assumption_challenging"],
                     tetrahedral_position=TetrahedralPosition.REFEREE.value
-                )
-                
+                ),
+                return_exceptions=True
+            )
+            
+            if isinstance(meta_prompts, Exception):
+                logger.warning(f"⚠️  Meta-prompt generation failed: {meta_prompts}")
+            else:
+                logger.info("✨ Generated cosmic meta-prompts for dialogue enhancement")
+                self.geometric_metadata.update({"meta_prompts": meta_prompts})
+            
+            agent_error = next(
+                (r for r in (advocate_agent, skeptic_agent) if isinstance(r, Exception)),
+                None
+            )
+            if agent_error is not None:
+                logger.warning(f"⚠️  Fractal agent creation failed: {agent_error}")
+            else:
                 logger.info("🎭 Created fractal agents for dialogue participants")
                 self.geometric_metadata.update({
                     "advocate_agent": advocate_agent,
                     "skeptic_agent": skeptic_agent
                 })
-            except Exception as e:
-                logger.warning(f"⚠️  Fractal agent creation failed: {e}")
             
             # Execute the dialogue rounds
             return await self._execute_dialogue_rounds(client)
+        finally:
+            await session.close()
     
     async def _execute_dialogue_rounds(self, client: HoCoreClient) -> Dict[str, Any]:
         """Execute the main dialogue rounds with geometric timing"""
         thesis = self.current_thesis
         
         for round_num in range(N_ROUNDS):
-            logger.info(f"🔄 === Round {round_num + 1}/{N_ROUNDS} ===")
+            logger.info("🔄 === Round {}/{} ===", round_num + 1, N_ROUNDS)
             
             # Initialize conversation for this round
-            advocate_messages = [{"role": "assistant", "content": thesis}]
-            skeptic_messages = [{"role": "user", "content": thesis}]
+            advocate_transcript = DialogueTranscript()
+            advocate_transcript.append("assistant", thesis)
+            skeptic_transcript = DialogueTranscript()
+            skeptic_transcript.append("user", thesis)
             
             # Execute turns with golden ratio timing
             for turn_num in range(N_TURNS):
-                logger.info(f"💫 Round {round_num + 1}, Turn {turn_num + 1}/{N_TURNS}")
+                logger.info("💫 Round {}, Turn {}/{}", round_num + 1, turn_num + 1, N_TURNS)
                 
                 # Skeptic responds (questioning phase)
-                skeptic_response = await self._get_provider_response(
-                    provider=self.skeptic_provider,
-                    messages=skeptic_messages,
-                    system_prompt=self._get_skeptic_prompt(),
-                    role="skeptic"
-                )
+                skeptic_response = await self._golden_paced(self._ask_skeptic(transcript=skeptic_transcript))
                 
-                skeptic_messages.append({"role": "assistant", "content": skeptic_response.content})
-                advocate_messages.append({"role": "user", "content": skeptic_response.content})
+                skeptic_transcript.append("assistant", skeptic_response.content)
+                advocate_transcript.append("user", skeptic_response.content)
                 self.conversation_history.append(skeptic_response)
                 
-                logger.info(f"🤔 Skeptic ({self.skeptic_provider.value}): {skeptic_response.content[:150]}...")
-                
-                # Golden ratio pause for reflection
-                await asyncio.sleep(1.0 / GOLDEN_RATIO)
+                logger.opt(lazy=True).info(
+                    "🤔 Skeptic ({}): {}...",
+                    lambda: self.skeptic_provider.value,
+                    lambda: skeptic_response.content[:150]
+                )
                 
                 # Advocate responds (defending phase)
-                advocate_response = await self._get_provider_response(
-                    provider=self.advocate_provider,
-                    messages=advocate_messages,
-                    system_prompt=self._get_advocate_prompt(),
-                    role="advocate"
-                )
+                advocate_response = await self._golden_paced(self._ask_advocate(transcript=advocate_transcript))
                 
-                advocate_messages.append({"role": "assistant", "content": advocate_response.content})
-                skeptic_messages.append({"role": "user", "content": advocate_response.content})
+                advocate_transcript.append("assistant", advocate_response.content)
+                skeptic_transcript.append("user", advocate_response.content)
                 self.conversation_history.append(advocate_response)
                 
-                logger.info(f"🎭 Advocate ({self.advocate_provider.value}): {advocate_response.content[:150]}...")
-                
-                # Another golden ratio pause
-                await asyncio.sleep(1.0 / GOLDEN_RATIO)
+                logger.opt(lazy=True).info(
+                    "🎭 Advocate ({}): {}...",
+                    lambda: self.advocate_provider.value,
+                    lambda: advocate_response.content[:150]
+                )
             
             # Moderator synthesizes and evolves the thesis
-            try:
-                recursive_result = await client.execute_recursive_orchestration(
-                    task_description=f"Synthesize and improve this thesis based on the Socratic dialogue: {thesis}",
-                    recursion_depth=FRACTAL_RECURSION_DEPTH,
-                    cosmic_parameters={
-                        "conversation_context": [msg.content for msg in self.conversation_history[-6:]],
-                        "geometric_constraints": {"golden_ratio_compliance": True}
-                    }
-                )
-                
-                # Extract the improved thesis from the recursive orchestration
-                thesis = recursive_result.get("improved_thesis", thesis)
-                logger.info(f"⚖️  Thesis evolution (Round {round_num + 1}): {thesis[:200]}...")
-                
-            except Exception as e:
-                logger.warning(f"⚠️  Recursive orchestration failed, using local moderator: {e}")
-                
-                # Fallback to local moderation
-                moderator_response = await self._get_provider_response(
-                    provider=self.moderator_provider,
-                    messages=skeptic_messages,
-                    system_prompt=self._get_moderator_prompt(),
-                    role="moderator"
-                )
-                thesis = moderator_response.content
-                self.conversation_history.append(moderator_response)
+            thesis = await self._moderate(client, thesis, skeptic_transcript, round_num)
         
         # Final results
         final_result = {
             "initial_thesis": self.current_thesis,
             "final_thesis": thesis,
-            "conversation_history": [
-                {
-                    "role": msg.role,
-                    "content": msg.content,
-                    "provider": msg.provider.value,
-                    "timestamp": msg.timestamp.isoformat(),
-                    "tokens_used": msg.tokens_used,
-                    "latency_ms": msg.latency_ms
-                }
-                for msg in self.conversation_history
-            ],
+            # orjson serializes the SocraticMessage dataclasses (and their enum/datetime fields) directly
+            "conversation_history": list(self.conversation_history),
             "geometric_metadata": self.geometric_metadata,
             "cosmic_metrics": {
                 "total_rounds": N_ROUNDS,
@@ -408,10 +518,52 @@ class CosmicSocraticDialogue:
         }
         
         logger.info("🌟 Cosmic Socratic Dialogue completed successfully!")
-        logger.info(f"📊 Final thesis: {thesis}")
+        logger.info("📊 Final thesis: {}", thesis)
         
         return final_result
     
+    async def _moderate(
+        self,
+        client: HoCoreClient,
+        thesis: str,
+        skeptic_transcript: DialogueTranscript,
+        round_num: int
+    ) -> str:
+        """Synthesize an evolved thesis from a round, falling back to the local moderator"""
+        try:
+            recursive_result = await client.execute_recursive_orchestration(
+                task_description=f"Synthesize and improve this thesis based on the Socratic dialogue: {thesis}",
+                recursion_depth=FRACTAL_RECURSION_DEPTH,
+                cosmic_parameters={
+                    "conversation_context": [
+                        msg.content
+                        for msg in islice(
+                            self.conversation_history,
+                            max(0, len(self.conversation_history) - 6),
+                            None
+                        )
+                    ],
+                    "geometric_constraints": {"golden_ratio_compliance": True}
+                }
+            )
+            
+            # Extract the improved thesis from the recursive orchestration
+            thesis = recursive_result.get("improved_thesis", thesis)
+            logger.opt(lazy=True).info(
+                "⚖️  Thesis evolution (Round {}): {}...",
+                lambda: round_num + 1,
+                lambda: thesis[:200]
+            )
+            return thesis
+            
+        except Exception as e:
+            logger.warning(f"⚠️  Recursive orchestration failed, using local moderator: {e}")
+            
+            # Fallback to local moderation
+            moderator_response = await self._ask_moderator(transcript=skeptic_transcript)
+            self.conversation_history.append(moderator_response)
+            return moderator_response.content
+    
     async def _execute_local_dialogue(self) -> Dict[str, Any]:
         """Fallback local execution when ho-core is unavailable"""
         logger.info("🔧 Executing local dialogue (ho-core unavailable)")
@@ -427,38 +579,51 @@ class CosmicSocraticDialogue:
             "cosmic_metrics": {"status": "limited"}
         }
     
+    async def _golden_paced(self, request: Awaitable[SocraticMessage]) -> SocraticMessage:
+        """Await a provider request, overlapping the optional golden ratio pause with it"""
+        if not ENABLE_GOLDEN_PAUSE:
+            return await request
+        response, _ = await asyncio.gather(request, asyncio.sleep(GOLDEN_PAUSE))
+        return response
+    
     async def _get_provider_response(
         self,
         provider: LLMProvider,
-        messages: List[Dict[str, str]],
+        transcript: DialogueTranscript,
         system_prompt: str,
         role: str
     ) -> SocraticMessage:
         """Get response from a specific LLM provider"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # This would integrate with the actual ho-core API
+        # This would integrate with the actual ho-core API, sending transcript.as_messages()
         # For now, implementing a mock response
-        mock_responses = {
-            LLMProvider.ANTHROPIC: f"As an advocate for this thesis, I must emphasize the fundamental importance of the philosophical framework presented. The geometric principles underlying AI orchestration are not merely decorative but essential structural elements...",
-            LLMProvider.GROK: f"But wait - isn't this just elaborate technobabble? How do we know that these 'geometric principles' aren't just marketing speak for existing distributed systems? Where's the empirical evidence?",
-            LLMProvider.KIMI_RESEARCH: f"Synthesizing the dialogue: The thesis has merit in its structural approach to AI coordination, but requires more rigorous mathematical foundation. The integration of geometric principles with agent behavior presents both opportunities and challenges..."
-        }
+        cache_key = _response_cache_key(provider, transcript, system_prompt)
+        response_content = _response_cache.get(cache_key)
+        if response_content is not None:
+            _response_cache.move_to_end(cache_key)
+        else:
+            response_content = _MOCK_RESPONSES.get(provider, f"Generic response from {provider.value}")
+            _response_cache[cache_key] = response_content
+            if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
         
-        response_content = mock_responses.get(provider, "Generic response from " + provider.value)
-        latency_ms = int((time.time() - start_time) * 1000)
+        end_ns = time.perf_counter_ns()
+        latency_ms = (end_ns - start_ns) // 1_000_000
         
         return SocraticMessage(
             role=role,
             content=response_content,
             provider=provider,
-            timestamp=datetime.now(),
-            tokens_used=len(response_content.split()) * 1.3,  # Rough approximation
+            timestamp=self._run_started_at + timedelta(microseconds=(end_ns - self._run_anchor_ns) // 1_000),
+            tokens_used=_count_tokens(response_content),
             latency_ms=latency_ms,
-            geometric_metrics={"golden_ratio_compliance": True}
+            geometric_metrics=_GOLDEN_COMPLIANT_METRICS
         )
     
-    def _get_advocate_prompt(self) -> str:
+    @staticmethod
+    @functools.cache
+    def _get_advocate_prompt() -> str:
         """System prompt for the advocate role"""
         return f"""
         You are engaging in a Socratic dialogue as the ADVOCATE.
@@ -473,7 +638,9 @@ class CosmicSocraticDialogue:
         Support claims with evidence and logical reasoning.
         """
     
-    def _get_skeptic_prompt(self) -> str:
+    @staticmethod
+    @functools.cache
+    def _get_skeptic_prompt() -> str:
         """System prompt for the skeptic role"""
         return f"""
         You are engaging in a Socratic dialogue as the SKEPTIC.
@@ -488,7 +655,9 @@ class CosmicSocraticDialogue:
         Demand evidence and challenge unproven assumptions.
         """
     
-    def _get_moderator_prompt(self) -> str:
+    @staticmethod
+    @functools.cache
+    def _get_moderator_prompt() -> str:
         """System prompt for the moderator role"""
         return f"""
         Create a more robust version of the thesis by integrating both advocacy and skepticism.
@@ -527,8 +696,8 @@ async def main():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"cosmic_dialogue_result_{timestamp}.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(result, default=_json_default, option=orjson.OPT_INDENT_2))
         
         print(f"\n✅ Cosmic dialogue completed successfully!")
         print(f"📄 Results saved to: {output_file}")
@@ -537,6 +706,8 @@ async def main():
     except Exception as e:
         logger.error(f"💥 Cosmic dialogue failed: {e}")
         sys.exit(1)
+    finally:
+        await close_shared_connector()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -25,16 +25,21 @@ import os
 import sys
 import json
 import asyncio
-import paramiko
-import aiohttp
+import orjson
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Dict, List, Optional, Any, Tuple
 from enum import Enum
 import logging
+import re
 from pathlib import Path
-import subprocess
 import time
+from contextlib import asynccontextmanager
+
+# asyncssh and aiohttp are imported where first used, keeping startup light
+if TYPE_CHECKING:
+    import aiohttp
+    import asyncssh
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='🌌 %(asctime)s | %(levelname)s | %(message)s')
@@ -46,6 +51,40 @@ TETRAHEDRAL_NODES = 4
 SANDLOOP_INTERVAL = int(60 * GOLDEN_RATIO)  # ~97 seconds
 FRACTAL_DEPTH = 3
 
+# Remote dialogue layout on each node
+REMOTE_DIALOGUE_SCRIPT = "/opt/ho-core/examples/socratic_dialogue.py"
+REMOTE_THESIS_FILE = "/opt/ho-core/examples/first_message.md"
+REMOTE_RESULT_GLOB = "/opt/ho-core/cosmic_dialogue_result_*.json"
+
+# Run coordinator + executor dialogues as one remote script when they share a node
+BATCH_ROUND_COMMANDS = os.getenv("SANDLOOP_BATCH", "0") == "1"
+ROUND_RESULT_BEGIN = "---BEGIN JSON---"
+ROUND_RESULT_END = "---END JSON---"
+ROUND_RESULT_PATTERN = re.compile(
+    re.escape(ROUND_RESULT_BEGIN).encode() + rb"\n(.*?)" + re.escape(ROUND_RESULT_END).encode(),
+    re.DOTALL
+)
+
+# Marks where remote dialogue output ends and the result file path begins
+RESULT_SENTINEL = "---SANDLOOP-RESULT---"
+RESULT_SENTINEL_LINE = f"{RESULT_SENTINEL}\n".encode()
+
+# How long a successful ho-core deployment probe is trusted (seconds)
+HOSTCHECK_TTL = timedelta(seconds=int(os.getenv("SANDLOOP_HOSTCHECK_TTL", str(24 * 60 * 60))))
+HOSTCHECK_CACHE_FILE = Path(os.path.expanduser("~/.cache/ergors/ssh_hostcheck.json"))
+
+# SSH keepalive settings applied to every pooled connection
+SSH_KEEPALIVE_INTERVAL = 30
+SSH_KEEPALIVE_COUNT_MAX = 3
+
+# Upper bound on concurrent per-node SSH operations during fan-out
+MAX_CONCURRENT = int(os.getenv("SANDLOOP_MAX_CONCURRENT", "32"))
+
+# SWIM-style failure detection thresholds
+HEARTBEAT_INTERVAL_MS = 1000
+FAILURE_THRESHOLD = 3  # Missed heartbeats before an alive node is suspected
+SUSPECT_TIMEOUT_MS = 5000  # Time a node may stay suspect before it is declared dead
+
 @dataclass
 class SSHConnection:
     """SSH connection configuration for remote nodes"""
@@ -57,6 +96,12 @@ class SSHConnection:
     ho_core_port: int = 8080
     ho_core_path: str = "/opt/ho-core/target/release/ho-core"
 
+class NodeState(Enum):
+    """SWIM membership state of a node"""
+    ALIVE = "alive"
+    SUSPECT = "suspect"
+    DEAD = "dead"
+
 @dataclass
 class NodeStatus:
     """Status of a remote ho-core node"""
@@ -67,6 +112,9 @@ class NodeStatus:
     active_tasks: int = 0
     tetrahedral_position: str = "Development"
     error_message: Optional[str] = None
+    state: NodeState = NodeState.ALIVE
+    missed_heartbeats: int = 0
+    suspect_since: Optional[datetime] = None
 
 @dataclass
 class SandloopState:
@@ -87,6 +135,32 @@ class TetrahedralPosition(Enum):
     REFEREE = "Referee"
     DEVELOPMENT = "Development"
 
+class _HostCheckCache:
+    """On-disk record of the last successful host probe, keyed by host/port/path"""
+    
+    def __init__(self, path: Path = HOSTCHECK_CACHE_FILE):
+        self.path = path
+        try:
+            self._entries: Dict[str, str] = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self._entries = {}
+    
+    def get(self, key: str) -> Optional[datetime]:
+        """Return when the probe for `key` last succeeded, if known"""
+        timestamp = self._entries.get(key)
+        return datetime.fromisoformat(timestamp) if timestamp else None
+    
+    def set(self, key: str):
+        """Record a successful probe now and persist the cache atomically"""
+        self._entries[key] = datetime.now().isoformat()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(self._entries), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug("Could not persist host check cache: %s", e)
+
 class SSHSandloopOrchestrator:
     """
     Orchestrates sandloop executions across SSH-connected ho-core nodes
@@ -103,7 +177,27 @@ class SSHSandloopOrchestrator:
             node_id = f"{config.host}:{config.ho_core_port}"
             self.nodes[node_id] = NodeStatus(ssh_config=config)
         
-        logger.info(f"🌐 Initialized SSH Sandloop Orchestrator with {len(ssh_configs)} nodes")
+        # One pooled SSH connection per (host, port, username), opened lazily
+        self._connections: Dict[Tuple[str, int, str], "asyncssh.SSHClientConnection"] = {}
+        self._connection_locks: Dict[Tuple[str, int, str], asyncio.Lock] = {}
+        
+        # Running nodes indexed by tetrahedral position, in node order
+        self._by_position: Dict[str, List[str]] = {p.value: [] for p in TetrahedralPosition}
+        self._running_nodes: List[str] = []
+        
+        # Bounds per-node SSH fan-out so large clusters don't exhaust file descriptors
+        self._ssh_sem = asyncio.Semaphore(MAX_CONCURRENT)
+        
+        # Cached results of remote deployment probes
+        self._host_checks = _HostCheckCache()
+        
+        # Shared HTTP session for synthesis and health requests, created on first use
+        self._aio: Optional["aiohttp.ClientSession"] = None
+        
+        # Whether ho-core serves the aggregated /cluster/health view; None until a node answers
+        self._cluster_view_supported: Optional[bool] = None
+        
+        logger.info("🌐 Initialized SSH Sandloop Orchestrator with %d nodes", len(ssh_configs))
     
     async def setup_sandloop_demonstration(self) -> bool:
         """
@@ -113,13 +207,17 @@ class SSHSandloopOrchestrator:
         
         # Phase 1: Test SSH connections
         logger.info("📡 Phase 1: Testing SSH connections...")
+        outcomes = await self._run_on_nodes({
+            node_id: self._test_ssh_connection(node_status)
+            for node_id, node_status in self.nodes.items()
+        })
         success_count = 0
-        for node_id, node_status in self.nodes.items():
-            if await self._test_ssh_connection(node_status):
+        for node_id, ok in outcomes.items():
+            if ok:
                 success_count += 1
-                logger.info(f"✅ SSH connection successful: {node_id}")
+                logger.info("✅ SSH connection successful: %s", node_id)
             else:
-                logger.error(f"❌ SSH connection failed: {node_id}")
+                logger.error("❌ SSH connection failed: %s", node_id)
         
         if success_count < 2:
             logger.error("❌ Need at least 2 working SSH connections for demonstration")
@@ -127,40 +225,57 @@ class SSHSandloopOrchestrator:
         
         # Phase 2: Deploy ho-core to remote nodes
         logger.info("📦 Phase 2: Deploying ho-core to remote nodes...")
+        outcomes = await self._run_on_nodes({
+            node_id: self._deploy_ho_core(node_status)
+            for node_id, node_status in self.nodes.items()
+            if node_status.is_connected
+        })
         deployed_count = 0
-        for node_id, node_status in self.nodes.items():
-            if node_status.is_connected:
-                if await self._deploy_ho_core(node_status):
-                    deployed_count += 1
-                    logger.info(f"✅ Ho-core deployed: {node_id}")
-                else:
-                    logger.error(f"❌ Ho-core deployment failed: {node_id}")
+        for node_id, ok in outcomes.items():
+            if ok:
+                deployed_count += 1
+                logger.info("✅ Ho-core deployed: %s", node_id)
+            else:
+                logger.error("❌ Ho-core deployment failed: %s", node_id)
         
         # Phase 3: Start ho-core nodes with tetrahedral positioning
         logger.info("🔺 Phase 3: Starting ho-core nodes with tetrahedral coordination...")
         positions = list(TetrahedralPosition)
+        assignments = {
+            node_id: positions[i % len(positions)]
+            for i, (node_id, node_status) in enumerate(self.nodes.items())
+            if node_status.is_connected
+        }
+        outcomes = await self._run_on_nodes({
+            node_id: self._start_ho_core_node(self.nodes[node_id], position)
+            for node_id, position in assignments.items()
+        })
         running_count = 0
-        
-        for i, (node_id, node_status) in enumerate(self.nodes.items()):
-            if node_status.is_connected:
-                position = positions[i % len(positions)]
-                if await self._start_ho_core_node(node_status, position):
-                    node_status.tetrahedral_position = position.value
-                    running_count += 1
-                    logger.info(f"✅ Ho-core started: {node_id} ({position.value})")
-                else:
-                    logger.error(f"❌ Ho-core start failed: {node_id}")
+        for node_id, ok in outcomes.items():
+            position = assignments[node_id]
+            if ok:
+                self.nodes[node_id].tetrahedral_position = position.value
+                self._by_position[position.value].append(node_id)
+                self._running_nodes.append(node_id)
+                running_count += 1
+                logger.info("✅ Ho-core started: %s (%s)", node_id, position.value)
+            else:
+                logger.error("❌ Ho-core start failed: %s", node_id)
         
         # Phase 4: Deploy Socratic dialogue script
         logger.info("📜 Phase 4: Deploying Socratic dialogue scripts...")
+        outcomes = await self._run_on_nodes({
+            node_id: self._deploy_socratic_script(node_status)
+            for node_id, node_status in self.nodes.items()
+            if node_status.ho_core_running
+        })
         script_deployed_count = 0
-        for node_id, node_status in self.nodes.items():
-            if node_status.ho_core_running:
-                if await self._deploy_socratic_script(node_status):
-                    script_deployed_count += 1
-                    logger.info(f"✅ Socratic script deployed: {node_id}")
-                else:
-                    logger.error(f"❌ Socratic script deployment failed: {node_id}")
+        for node_id, ok in outcomes.items():
+            if ok:
+                script_deployed_count += 1
+                logger.info("✅ Socratic script deployed: %s", node_id)
+            else:
+                logger.error("❌ Socratic script deployment failed: %s", node_id)
         
         # Phase 5: Initialize network coordination
         logger.info("🕸️  Phase 5: Initializing network coordination...")
@@ -171,7 +286,7 @@ class SSHSandloopOrchestrator:
         
         success = running_count >= 2 and script_deployed_count >= 2
         if success:
-            logger.info(f"🌟 Sandloop demonstration setup completed! ({running_count} nodes active)")
+            logger.info("🌟 Sandloop demonstration setup completed! (%d nodes active)", running_count)
         else:
             logger.error("❌ Sandloop demonstration setup failed")
         
@@ -181,22 +296,27 @@ class SSHSandloopOrchestrator:
         """
         Execute the main sandloop demonstration with geometric coordination
         """
-        loop_id = f"sandloop_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now
+        # Golden ratio pauses between rounds, decreasing each round
+        waits = tuple(SANDLOOP_INTERVAL / (i + 1) for i in range(total_rounds - 1))
+        
+        start_time = now()
+        loop_id = f"sandloop_{start_time.strftime('%Y%m%d_%H%M%S')}"
         
         self.sandloop_state = SandloopState(
             loop_id=loop_id,
-            start_time=datetime.now(),
+            start_time=start_time,
             current_round=0,
             total_rounds=total_rounds,
             active_nodes=[node_id for node_id, status in self.nodes.items() if status.ho_core_running]
         )
         
-        logger.info(f"🌀 Starting Sandloop Demonstration: {loop_id}")
-        logger.info(f"🔢 Configuration: {total_rounds} rounds, {len(self.sandloop_state.active_nodes)} active nodes")
+        logger.info("🌀 Starting Sandloop Demonstration: %s", loop_id)
+        logger.info("🔢 Configuration: %d rounds, %d active nodes", total_rounds, len(self.sandloop_state.active_nodes))
         
         results = {
             "loop_id": loop_id,
-            "start_time": self.sandloop_state.start_time.isoformat(),
+            "start_time": start_time.isoformat(),
             "configuration": {
                 "total_rounds": total_rounds,
                 "active_nodes": self.sandloop_state.active_nodes,
@@ -209,33 +329,40 @@ class SSHSandloopOrchestrator:
             "rounds": []
         }
         
+        # With the aggregated cluster view, failure detection runs on the heartbeat
+        # cadence; without it, every node is polled once per round instead
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
         try:
             for round_num in range(total_rounds):
-                logger.info(f"🔄 === Round {round_num + 1}/{total_rounds} ===")
+                logger.info("🔄 === Round %d/%d ===", round_num + 1, total_rounds)
+                await self._await_quorum()
                 self.sandloop_state.current_round = round_num + 1
                 
                 round_result = await self._execute_sandloop_round(round_num)
                 results["rounds"].append(round_result)
                 
-                # Health check between rounds
-                await self._health_check_all_nodes()
+                if not self._cluster_view_supported:
+                    await self._gossip_refresh()
                 
                 # Golden ratio interval between rounds
                 if round_num < total_rounds - 1:
-                    wait_time = SANDLOOP_INTERVAL / (round_num + 1)  # Decreasing intervals
-                    logger.info(f"⏱️  Golden ratio pause: {wait_time:.1f} seconds")
+                    wait_time = waits[round_num]
+                    logger.info("⏱️  Golden ratio pause: %.1f seconds", wait_time)
                     await asyncio.sleep(wait_time)
             
+            end_time = now()
             results["status"] = "completed"
-            results["end_time"] = datetime.now().isoformat()
-            results["total_duration"] = (datetime.now() - self.sandloop_state.start_time).total_seconds()
+            results["end_time"] = end_time.isoformat()
+            results["total_duration"] = (end_time - start_time).total_seconds()
             
             logger.info("🌟 Sandloop demonstration completed successfully!")
             
         except Exception as e:
-            logger.error(f"💥 Sandloop demonstration failed: {e}")
+            logger.error("💥 Sandloop demonstration failed: %s", e)
             results["status"] = "failed"
             results["error"] = str(e)
+        finally:
+            heartbeat.cancel()
         
         return results
     
@@ -248,7 +375,7 @@ class SSHSandloopOrchestrator:
         executor_node = self._select_node_by_position(TetrahedralPosition.EXECUTOR)
         referee_node = self._select_node_by_position(TetrahedralPosition.REFEREE)
         
-        logger.info(f"🔺 Tetrahedral assignment - Coordinator: {coordinator_node}, Executor: {executor_node}, Referee: {referee_node}")
+        logger.info("🔺 Tetrahedral assignment - Coordinator: %s, Executor: %s, Referee: %s", coordinator_node, executor_node, referee_node)
         
         # Create dialogue task configuration
         dialogue_config = {
@@ -272,27 +399,36 @@ class SSHSandloopOrchestrator:
         }
         
         try:
-            # Phase 1: Initiate dialogue on coordinator node
-            logger.info("🎭 Phase 1: Initiating Socratic dialogue on coordinator node...")
-            coordinator_result = await self._execute_remote_dialogue(
-                self.nodes[coordinator_node],
-                "coordinator",
-                round_num
-            )
+            if BATCH_ROUND_COMMANDS and coordinator_node == executor_node:
+                # Phases 1-2: Both roles share a node, so run them in one remote script
+                logger.info("🎭 Phases 1-2: Running coordinator and executor dialogues in one remote script...")
+                coordinator_result, executor_result = await self._execute_batched_dialogues(
+                    self.nodes[coordinator_node],
+                    round_num
+                )
+            else:
+                # Phase 1: Initiate dialogue on coordinator node
+                logger.info("🎭 Phase 1: Initiating Socratic dialogue on coordinator node...")
+                coordinator_result = await self._execute_remote_dialogue(
+                    self.nodes[coordinator_node],
+                    "coordinator",
+                    round_num
+                )
+                
+                # Phase 2: Execute on executor node
+                logger.info("⚡ Phase 2: Executing dialogue continuation on executor node...")
+                executor_result = await self._execute_remote_dialogue(
+                    self.nodes[executor_node],
+                    "executor",
+                    round_num,
+                    previous_context=coordinator_result.get("final_thesis")
+                )
+            
             round_result["dialogue_phases"].append({
                 "phase": "coordinator_initiation",
                 "node": coordinator_node,
                 "result": coordinator_result
             })
-            
-            # Phase 2: Execute on executor node
-            logger.info("⚡ Phase 2: Executing dialogue continuation on executor node...")
-            executor_result = await self._execute_remote_dialogue(
-                self.nodes[executor_node],
-                "executor",
-                round_num,
-                previous_context=coordinator_result.get("final_thesis")
-            )
             round_result["dialogue_phases"].append({
                 "phase": "executor_continuation",
                 "node": executor_node,
@@ -317,14 +453,15 @@ class SSHSandloopOrchestrator:
             if referee_result and referee_result.get("synthesized_thesis"):
                 self.sandloop_state.current_dialogue = referee_result["synthesized_thesis"]
             
+            round_end = datetime.now()
             round_result["status"] = "completed"
-            round_result["end_time"] = datetime.now().isoformat()
-            round_result["duration"] = (datetime.now() - round_start).total_seconds()
+            round_result["end_time"] = round_end.isoformat()
+            round_result["duration"] = (round_end - round_start).total_seconds()
             
-            logger.info(f"✅ Round {round_num + 1} completed in {round_result['duration']:.1f}s")
+            logger.info("✅ Round %d completed in %.1fs", round_num + 1, round_result['duration'])
             
         except Exception as e:
-            logger.error(f"❌ Round {round_num + 1} failed: {e}")
+            logger.error("❌ Round %d failed: %s", round_num + 1, e)
             round_result["status"] = "failed"
             round_result["error"] = str(e)
         
@@ -338,13 +475,13 @@ class SSHSandloopOrchestrator:
         previous_context: Optional[str] = None
     ) -> Dict[str, Any]:
         """Execute Socratic dialogue on a remote node via SSH"""
-        logger.info(f"🗣️  Executing remote dialogue on {node.ssh_config.host} (role: {role})")
+        logger.info("🗣️  Executing remote dialogue on %s (role: %s)", node.ssh_config.host, role)
         
         # Prepare the dialogue command
         dialogue_cmd = [
             "python3", 
-            "/opt/ho-core/examples/socratic_dialogue.py",
-            "/opt/ho-core/examples/first_message.md"
+            REMOTE_DIALOGUE_SCRIPT,
+            REMOTE_THESIS_FILE
         ]
         
         if previous_context:
@@ -354,61 +491,102 @@ class SSHSandloopOrchestrator:
             dialogue_cmd[-1] = context_file
         
         try:
-            # Execute the dialogue via SSH
-            ssh_client = paramiko.SSHClient()
-            ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            ssh_client.connect(
-                hostname=node.ssh_config.host,
-                port=node.ssh_config.port,
-                username=node.ssh_config.username,
-                key_filename=node.ssh_config.key_file,
-                password=node.ssh_config.password,
-                timeout=30
-            )
-            
             # Run the dialogue command
             cmd_str = " ".join(dialogue_cmd)
-            logger.info(f"🔧 Executing: {cmd_str}")
+            logger.info("🔧 Executing: %s", cmd_str)
             
-            stdin, stdout, stderr = ssh_client.exec_command(cmd_str)
+            # Run the dialogue and print the newest result file's path after a sentinel line;
+            # the file itself is then fetched over SFTP
+            remote_cmd = (
+                f"{cmd_str} && echo '{RESULT_SENTINEL}' && "
+                f"ls {REMOTE_RESULT_GLOB} 2>/dev/null | tail -1"
+            )
             
-            # Wait for completion with timeout
-            exit_status = stdout.channel.recv_exit_status()
+            # Execute the dialogue via SSH and wait for completion
+            async with self._connect(node) as conn:
+                result = await conn.run(remote_cmd, encoding=None)
             
-            if exit_status == 0:
-                # Parse the output
-                output = stdout.read().decode('utf-8')
-                error = stderr.read().decode('utf-8')
+            if result.exit_status == 0:
+                # Split the dialogue output from the result file path
+                output, _, result_path = result.stdout.partition(RESULT_SENTINEL_LINE)
+                result_path = result_path.decode('utf-8').strip()
+                error = result.stderr.decode('utf-8', errors='replace')
                 
-                # Look for the result file
-                result_files_cmd = "ls /opt/ho-core/cosmic_dialogue_result_*.json | tail -1"
-                _, result_stdout, _ = ssh_client.exec_command(result_files_cmd)
-                result_file = result_stdout.read().decode('utf-8').strip()
-                
-                if result_file:
-                    # Retrieve the result file
-                    _, file_stdout, _ = ssh_client.exec_command(f"cat {result_file}")
-                    result_content = file_stdout.read().decode('utf-8')
-                    result_data = json.loads(result_content)
+                if result_path:
+                    result_data = await self._read_remote_json(node, result_path)
                     
-                    logger.info(f"✅ Remote dialogue completed on {node.ssh_config.host}")
+                    logger.info("✅ Remote dialogue completed on %s", node.ssh_config.host)
                     return result_data
                 else:
-                    logger.warning(f"⚠️  No result file found on {node.ssh_config.host}")
-                    return {"status": "no_result", "output": output, "error": error}
+                    logger.warning("⚠️  No result file found on %s", node.ssh_config.host)
+                    return {"status": "no_result", "output": output.decode('utf-8', errors='replace'), "error": error}
             
             else:
-                error = stderr.read().decode('utf-8')
-                logger.error(f"❌ Remote dialogue failed on {node.ssh_config.host}: {error}")
-                return {"status": "failed", "exit_code": exit_status, "error": error}
+                error = result.stderr.decode('utf-8', errors='replace')
+                logger.error("❌ Remote dialogue failed on %s: %s", node.ssh_config.host, error)
+                return {"status": "failed", "exit_code": result.exit_status, "error": error}
         
         except Exception as e:
-            logger.error(f"❌ SSH execution failed on {node.ssh_config.host}: {e}")
+            logger.error("❌ SSH execution failed on %s: %s", node.ssh_config.host, e)
             return {"status": "error", "error": str(e)}
+    
+    def _build_round_script(self, round_num: int) -> str:
+        """Build a remote script running the coordinator then executor dialogue, emitting both result paths"""
+        context_file = f"/tmp/context_round_{round_num}.md"
+        latest_result = f"f=$(ls {REMOTE_RESULT_GLOB} 2>/dev/null | tail -1)"
+        emit_result = f"echo '{ROUND_RESULT_BEGIN}'; echo \"$f\"; echo '{ROUND_RESULT_END}'"
+        extract_thesis = 'import json, sys; print(json.load(open(sys.argv[1])).get("final_thesis") or "", end="")'
+        return "\n".join([
+            "set -e",
+            f"python3 {REMOTE_DIALOGUE_SCRIPT} {REMOTE_THESIS_FILE}",
+            latest_result,
+            emit_result,
+            f"thesis={REMOTE_THESIS_FILE}",
+            f"if [ -n \"$f\" ] && python3 -c '{extract_thesis}' \"$f\" > {context_file} && [ -s {context_file} ]; "
+            f"then thesis={context_file}; fi",
+            f"python3 {REMOTE_DIALOGUE_SCRIPT} \"$thesis\"",
+            latest_result,
+            emit_result,
+        ])
+    
+    async def _execute_batched_dialogues(
+        self,
+        node: NodeStatus,
+        round_num: int
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Execute the coordinator and executor dialogues on one node with a single remote command"""
+        logger.info("🗣️  Executing batched dialogues on %s (roles: coordinator, executor)", node.ssh_config.host)
         
-        finally:
-            ssh_client.close()
+        try:
+            async with self._connect(node) as conn:
+                result = await conn.run(self._build_round_script(round_num), encoding=None)
+        except Exception as e:
+            logger.error("❌ SSH execution failed on %s: %s", node.ssh_config.host, e)
+            return {"status": "error", "error": str(e)}, {"status": "error", "error": str(e)}
+        
+        error = result.stderr.decode('utf-8', errors='replace')
+        phase_results: List[Dict[str, Any]] = []
+        for payload in ROUND_RESULT_PATTERN.findall(result.stdout)[:2]:
+            result_path = payload.decode('utf-8').strip()
+            if result_path:
+                try:
+                    phase_results.append(await self._read_remote_json(node, result_path))
+                except Exception as e:
+                    logger.error("❌ Could not read %s on %s: %s", result_path, node.ssh_config.host, e)
+                    phase_results.append({"status": "error", "error": str(e)})
+            else:
+                phase_results.append({"status": "no_result", "error": error})
+        
+        # Dialogues that never emitted a result block failed before reaching it (set -e)
+        while len(phase_results) < 2:
+            phase_results.append({"status": "failed", "exit_code": result.exit_status, "error": error})
+        
+        if result.exit_status == 0:
+            logger.info("✅ Batched dialogues completed on %s", node.ssh_config.host)
+        else:
+            logger.error("❌ Batched dialogues failed on %s: %s", node.ssh_config.host, error)
+        
+        return phase_results[0], phase_results[1]
     
     async def _execute_remote_synthesis(
         self,
@@ -418,7 +596,7 @@ class SSHSandloopOrchestrator:
         round_num: int
     ) -> Dict[str, Any]:
         """Execute thesis synthesis on referee node"""
-        logger.info(f"🔬 Executing synthesis on referee node {node.ssh_config.host}")
+        logger.info("🔬 Executing synthesis on referee node %s", node.ssh_config.host)
         
         # Create synthesis prompt
         synthesis_prompt = f"""
@@ -440,68 +618,127 @@ class SSHSandloopOrchestrator:
         api_url = f"http://{node.ssh_config.host}:{node.ssh_config.ho_core_port}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                synthesis_payload = {
-                    "task_description": f"Synthesize theses with geometric principles: {synthesis_prompt[:500]}...",
-                    "recursion_depth": FRACTAL_DEPTH,
-                    "cosmic_parameters": {
-                        "thesis_a": thesis_a,
-                        "thesis_b": thesis_b,
-                        "geometric_constraints": {"golden_ratio": GOLDEN_RATIO}
-                    }
+            session = await self._session()
+            synthesis_payload = {
+                "task_description": f"Synthesize theses with geometric principles: {synthesis_prompt[:500]}...",
+                "recursion_depth": FRACTAL_DEPTH,
+                "cosmic_parameters": {
+                    "thesis_a": thesis_a,
+                    "thesis_b": thesis_b,
+                    "geometric_constraints": {"golden_ratio": GOLDEN_RATIO}
                 }
+            }
+            
+            async with session.post(
+                f"{api_url}/python/recursive-orchestration",
+                data=orjson.dumps(synthesis_payload),
+                headers={"Content-Type": "application/json"},
+                timeout=60
+            ) as response:
+                if response.status == 200:
+                    result = orjson.loads(await response.read())
+                    if result.get("success"):
+                        synthesis_data = result.get("data", {})
+                        logger.info("✅ Synthesis completed on %s", node.ssh_config.host)
+                        return {
+                            "synthesized_thesis": synthesis_data.get("result", "Synthesis completed"),
+                            "geometric_metrics": synthesis_data.get("geometric_metadata", {}),
+                            "status": "completed"
+                        }
                 
-                async with session.post(
-                    f"{api_url}/python/recursive-orchestration",
-                    json=synthesis_payload,
-                    timeout=60
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        if result.get("success"):
-                            synthesis_data = result.get("data", {})
-                            logger.info(f"✅ Synthesis completed on {node.ssh_config.host}")
-                            return {
-                                "synthesized_thesis": synthesis_data.get("result", "Synthesis completed"),
-                                "geometric_metrics": synthesis_data.get("geometric_metadata", {}),
-                                "status": "completed"
-                            }
-                    
-                    logger.warning(f"⚠️  Synthesis API call failed: {response.status}")
-                    return {"status": "api_failed", "error": f"HTTP {response.status}"}
+                logger.warning("⚠️  Synthesis API call failed: %s", response.status)
+                return {"status": "api_failed", "error": f"HTTP {response.status}"}
         
         except Exception as e:
-            logger.error(f"❌ Synthesis failed on {node.ssh_config.host}: {e}")
+            logger.error("❌ Synthesis failed on %s: %s", node.ssh_config.host, e)
             return {"status": "error", "error": str(e)}
     
     # Helper methods for node management
     
+    async def _run_on_nodes(self, calls: Dict[str, Awaitable[bool]]) -> Dict[str, bool]:
+        """Run one setup step on several nodes concurrently, keyed by node id"""
+        async def bounded(call: Awaitable[bool]) -> bool:
+            async with self._ssh_sem:
+                return await call
+        
+        results = await asyncio.gather(*map(bounded, calls.values()), return_exceptions=True)
+        return {node_id: result is True for node_id, result in zip(calls, results)}
+    
+    async def _get_conn(self, node: NodeStatus, connect_timeout: float = 30) -> "asyncssh.SSHClientConnection":
+        """Return the pooled SSH connection for a node, reconnecting if it was closed"""
+        import asyncssh
+        
+        config = node.ssh_config
+        key = (config.host, config.port, config.username)
+        async with self._connection_locks.setdefault(key, asyncio.Lock()):
+            conn = self._connections.get(key)
+            if conn is None or conn.is_closed():
+                conn = await asyncssh.connect(
+                    config.host,
+                    port=config.port,
+                    username=config.username,
+                    client_keys=[config.key_file] if config.key_file else None,
+                    password=config.password,
+                    known_hosts=None,
+                    connect_timeout=connect_timeout,
+                    keepalive_interval=SSH_KEEPALIVE_INTERVAL,
+                    keepalive_count_max=SSH_KEEPALIVE_COUNT_MAX
+                )
+                self._connections[key] = conn
+            return conn
+    
+    @asynccontextmanager
+    async def _connect(self, node: NodeStatus, connect_timeout: float = 30):
+        """Borrow the node's pooled SSH connection, dropping it from the pool if the link fails mid-use"""
+        import asyncssh
+        
+        conn = await self._get_conn(node, connect_timeout)
+        try:
+            yield conn
+        except (asyncssh.DisconnectError, OSError):
+            config = node.ssh_config
+            key = (config.host, config.port, config.username)
+            if self._connections.get(key) is conn:
+                del self._connections[key]
+            conn.close()
+            raise
+    
+    async def _session(self) -> "aiohttp.ClientSession":
+        """Return the shared keep-alive HTTP session for ho-core API calls"""
+        import aiohttp
+        
+        if self._aio is None or self._aio.closed:
+            self._aio = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit_per_host=4, keepalive_timeout=120),
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+        return self._aio
+    
+    async def aclose(self):
+        """Close the shared HTTP session and all pooled SSH connections"""
+        if self._aio is not None:
+            await self._aio.close()
+            self._aio = None
+        
+        connections = list(self._connections.values())
+        self._connections.clear()
+        for conn in connections:
+            conn.close()
+        await asyncio.gather(*(conn.wait_closed() for conn in connections), return_exceptions=True)
+    
     async def _test_ssh_connection(self, node: NodeStatus) -> bool:
         """Test SSH connection to a node"""
         try:
-            ssh_client = paramiko.SSHClient()
-            ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            ssh_client.connect(
-                hostname=node.ssh_config.host,
-                port=node.ssh_config.port,
-                username=node.ssh_config.username,
-                key_filename=node.ssh_config.key_file,
-                password=node.ssh_config.password,
-                timeout=10
-            )
-            
             # Test basic command
-            stdin, stdout, stderr = ssh_client.exec_command("echo 'SSH connection test'")
-            output = stdout.read().decode('utf-8').strip()
-            
-            ssh_client.close()
+            async with self._connect(node, connect_timeout=10) as conn:
+                result = await conn.run("echo 'SSH connection test'")
+            output = result.stdout.strip()
             
             node.is_connected = (output == "SSH connection test")
             return node.is_connected
         
         except Exception as e:
-            logger.error(f"SSH connection test failed for {node.ssh_config.host}: {e}")
+            logger.error("SSH connection test failed for %s: %s", node.ssh_config.host, e)
             node.is_connected = False
             node.error_message = str(e)
             return False
@@ -518,33 +755,29 @@ class SSHSandloopOrchestrator:
             # 3. Installing dependencies
             # For the demo, we'll assume ho-core is already deployed
             
-            ssh_client = paramiko.SSHClient()
-            ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            ssh_client.connect(
-                hostname=node.ssh_config.host,
-                port=node.ssh_config.port,
-                username=node.ssh_config.username,
-                key_filename=node.ssh_config.key_file,
-                password=node.ssh_config.password
-            )
+            # Skip the probe if this deployment was confirmed recently
+            check_key = f"{node.ssh_config.host}:{node.ssh_config.port}:{node.ssh_config.ho_core_path}"
+            checked_at = self._host_checks.get(check_key)
+            if checked_at and datetime.now() - checked_at < HOSTCHECK_TTL:
+                logger.info("✅ Ho-core deployment on %s confirmed at %s (cached)", node.ssh_config.host, format(checked_at, '%Y-%m-%d %H:%M'))
+                return True
             
             # Check if ho-core exists
-            stdin, stdout, stderr = ssh_client.exec_command(f"test -f {node.ssh_config.ho_core_path} && echo 'exists'")
-            exists = "exists" in stdout.read().decode('utf-8')
-            
-            ssh_client.close()
+            async with self._connect(node) as conn:
+                result = await conn.run(f"test -f {node.ssh_config.ho_core_path} && echo 'exists'")
+            exists = "exists" in result.stdout
             
             if exists:
-                logger.info(f"✅ Ho-core already deployed on {node.ssh_config.host}")
+                self._host_checks.set(check_key)
+                logger.info("✅ Ho-core already deployed on %s", node.ssh_config.host)
                 return True
             else:
-                logger.info(f"📦 Ho-core needs to be deployed to {node.ssh_config.host}")
+                logger.info("📦 Ho-core needs to be deployed to %s", node.ssh_config.host)
                 # In a real implementation, we would copy the binary here
                 return True  # For demo purposes
         
         except Exception as e:
-            logger.error(f"Ho-core deployment failed for {node.ssh_config.host}: {e}")
+            logger.error("Ho-core deployment failed for %s: %s", node.ssh_config.host, e)
             return False
     
     async def _start_ho_core_node(self, node: NodeStatus, position: TetrahedralPosition) -> bool:
@@ -553,47 +786,35 @@ class SSHSandloopOrchestrator:
             return False
         
         try:
-            ssh_client = paramiko.SSHClient()
-            ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            ssh_client.connect(
-                hostname=node.ssh_config.host,
-                port=node.ssh_config.port,
-                username=node.ssh_config.username,
-                key_filename=node.ssh_config.key_file,
-                password=node.ssh_config.password
-            )
-            
-            # Start ho-core in the background
+            # Start ho-core in the background (detached from the channel's stdin)
             start_cmd = f"""
             cd /opt/ho-core && 
             nohup {node.ssh_config.ho_core_path} start \\
                 --port {node.ssh_config.ho_core_port} \\
                 --p2p-port {node.ssh_config.ho_core_port + 1000} \\
-                --log-level info > ho-core.log 2>&1 &
+                --log-level info < /dev/null > ho-core.log 2>&1 &
             """
             
-            stdin, stdout, stderr = ssh_client.exec_command(start_cmd)
-            
-            # Wait a moment for startup
-            await asyncio.sleep(3)
-            
-            # Check if the process is running
-            stdin, stdout, stderr = ssh_client.exec_command("pgrep -f ho-core")
-            pid = stdout.read().decode('utf-8').strip()
-            
-            ssh_client.close()
+            async with self._connect(node) as conn:
+                await conn.run(start_cmd)
+                
+                # Wait a moment for startup
+                await asyncio.sleep(3)
+                
+                # Check if the process is running
+                result = await conn.run("pgrep -f ho-core")
+            pid = result.stdout.strip()
             
             node.ho_core_running = bool(pid)
             if node.ho_core_running:
-                logger.info(f"✅ Ho-core started on {node.ssh_config.host} (PID: {pid})")
+                logger.info("✅ Ho-core started on %s (PID: %s)", node.ssh_config.host, pid)
             else:
-                logger.error(f"❌ Ho-core failed to start on {node.ssh_config.host}")
+                logger.error("❌ Ho-core failed to start on %s", node.ssh_config.host)
             
             return node.ho_core_running
         
         except Exception as e:
-            logger.error(f"Ho-core start failed for {node.ssh_config.host}: {e}")
+            logger.error("Ho-core start failed for %s: %s", node.ssh_config.host, e)
             return False
     
     async def _deploy_socratic_script(self, node: NodeStatus) -> bool:
@@ -605,64 +826,159 @@ class SSHSandloopOrchestrator:
     async def _write_remote_file(self, node: NodeStatus, remote_path: str, content: str) -> bool:
         """Write content to a file on remote node"""
         try:
-            ssh_client = paramiko.SSHClient()
-            ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            ssh_client.connect(
-                hostname=node.ssh_config.host,
-                port=node.ssh_config.port,
-                username=node.ssh_config.username,
-                key_filename=node.ssh_config.key_file,
-                password=node.ssh_config.password
-            )
+            # Stream the bytes over SFTP on the pooled connection (binary-safe, no shell quoting)
+            async with self._connect(node) as conn, conn.start_sftp_client() as sftp:
+                async with sftp.open(remote_path, 'wb') as f:
+                    await f.write(content.encode('utf-8'))
             
-            # Use echo to write content (for short content)
-            # In production, would use SFTP for larger files
-            escaped_content = content.replace("'", "'\"'\"'")  # Escape single quotes
-            cmd = f"echo '{escaped_content}' > {remote_path}"
-            
-            stdin, stdout, stderr = ssh_client.exec_command(cmd)
-            exit_status = stdout.channel.recv_exit_status()
-            
-            ssh_client.close()
-            
-            return exit_status == 0
+            return True
         
         except Exception as e:
-            logger.error(f"Failed to write remote file {remote_path}: {e}")
+            logger.error("Failed to write remote file %s: %s", remote_path, e)
             return False
     
+    async def _read_remote_json(self, node: NodeStatus, remote_path: str) -> Dict[str, Any]:
+        """Read and parse a JSON file from a remote node over SFTP"""
+        async with self._connect(node) as conn, conn.start_sftp_client() as sftp:
+            async with sftp.open(remote_path, 'rb') as f:
+                return orjson.loads(await f.read())
+    
     def _select_node_by_position(self, position: TetrahedralPosition) -> Optional[str]:
         """Select a node by its tetrahedral position"""
-        for node_id, node_status in self.nodes.items():
-            if (node_status.ho_core_running and 
-                node_status.tetrahedral_position == position.value):
-                return node_id
-        
-        # Fallback: select any running node
-        for node_id, node_status in self.nodes.items():
-            if node_status.ho_core_running:
+        nodes = self.nodes
+        for node_id in self._by_position[position.value]:
+            if nodes[node_id].state == NodeState.ALIVE:
                 return node_id
         
+        # Fallback: select any alive running node
+        return next((node_id for node_id in self._running_nodes if nodes[node_id].state == NodeState.ALIVE), None)
+    
+    @property
+    def quorum_available(self) -> bool:
+        """True when a majority of running nodes are alive"""
+        alive = sum(1 for node_id in self._running_nodes if self.nodes[node_id].state == NodeState.ALIVE)
+        return alive > len(self._running_nodes) // 2
+    
+    async def _await_quorum(self):
+        """Wait for a majority of running nodes to be alive before starting a round"""
+        deadline = time.monotonic() + SANDLOOP_INTERVAL
+        while not self.quorum_available:
+            if time.monotonic() >= deadline:
+                raise RuntimeError("Quorum unavailable: too few alive nodes to start the round")
+            logger.warning("⏳ Waiting for quorum of alive nodes...")
+            await asyncio.sleep(HEARTBEAT_INTERVAL_MS / 1000)
+            if not self._cluster_view_supported:
+                await self._gossip_refresh()
+    
+    async def _heartbeat_loop(self):
+        """Apply the cluster view every heartbeat interval until cancelled or the view is unsupported"""
+        # Never falls back to polling every node: at this cadence that would make the
+        # orchestrator the bottleneck, so without the view membership is refreshed per round
+        while self._cluster_view_supported is not False:
+            await asyncio.sleep(HEARTBEAT_INTERVAL_MS / 1000)
+            try:
+                view = await self._fetch_cluster_view()
+            except Exception as e:
+                logger.debug("Heartbeat refresh failed: %s", e)
+                continue
+            if view is not None:
+                self._apply_cluster_view(view)
+    
+    async def _gossip_refresh(self):
+        """Refresh node membership, preferring one node's aggregated cluster view over polling every node"""
+        view = await self._fetch_cluster_view()
+        if view is None:
+            await self._health_check_all_nodes()
+        else:
+            self._apply_cluster_view(view)
+    
+    def _apply_cluster_view(self, view: Dict[str, NodeState]):
+        """Adopt an aggregated membership view"""
+        now = datetime.now()
+        for node_id, state in view.items():
+            node_status = self.nodes.get(node_id)
+            if node_status is None or not node_status.ho_core_running:
+                continue
+            if state == NodeState.ALIVE:
+                self._record_heartbeat(node_id, node_status, True, now)
+            elif node_status.state != state:
+                # The cluster has already run failure detection; adopt its verdict
+                node_status.state = state
+                node_status.suspect_since = node_status.suspect_since or now
+                logger.warning("⚠️  Node %s reported %s by cluster view", node_id, state.value)
+    
+    async def _fetch_cluster_view(self) -> Optional[Dict[str, NodeState]]:
+        """Read the aggregated membership view from any alive node, or None if unavailable"""
+        if self._cluster_view_supported is False:
+            return None
+        session = await self._session()
+        for node_id in self._running_nodes:
+            node_status = self.nodes[node_id]
+            if node_status.state != NodeState.ALIVE:
+                continue
+            api_url = f"http://{node_status.ssh_config.host}:{node_status.ssh_config.ho_core_port}"
+            try:
+                async with session.get(f"{api_url}/cluster/health", timeout=10) as response:
+                    if response.status == 404:
+                        # Endpoint not exposed by this ho-core build; don't ask again
+                        logger.info("ℹ️  No /cluster/health on ho-core; polling nodes once per round")
+                        self._cluster_view_supported = False
+                        return None
+                    if response.status != 200:
+                        return None
+                    view = orjson.loads(await response.read())
+                self._cluster_view_supported = True
+                return {peer_id: NodeState(state) for peer_id, state in view.items()}
+            except Exception as e:
+                logger.debug("Cluster view unavailable from %s: %s", node_id, e)
         return None
     
+    def _record_heartbeat(self, node_id: str, node_status: NodeStatus, alive: bool, now: datetime):
+        """Apply one heartbeat outcome to a node's membership state (alive -> suspect -> dead)"""
+        if alive:
+            if node_status.state != NodeState.ALIVE:
+                logger.info("💚 Node %s is alive again", node_id)
+            node_status.state = NodeState.ALIVE
+            node_status.missed_heartbeats = 0
+            node_status.suspect_since = None
+            node_status.last_health_check = now
+            return
+        
+        node_status.missed_heartbeats += 1
+        if node_status.state == NodeState.ALIVE and node_status.missed_heartbeats >= FAILURE_THRESHOLD:
+            node_status.state = NodeState.SUSPECT
+            node_status.suspect_since = now
+            logger.warning("⚠️  Node %s suspected after %d missed heartbeats", node_id, node_status.missed_heartbeats)
+        elif (node_status.state == NodeState.SUSPECT
+              and (now - node_status.suspect_since).total_seconds() * 1000 >= SUSPECT_TIMEOUT_MS):
+            node_status.state = NodeState.DEAD
+            logger.error("💀 Node %s declared dead", node_id)
+    
     async def _health_check_all_nodes(self):
         """Perform health check on all nodes"""
-        for node_id, node_status in self.nodes.items():
-            if node_status.ho_core_running:
-                try:
-                    api_url = f"http://{node_status.ssh_config.host}:{node_status.ssh_config.ho_core_port}"
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(f"{api_url}/health", timeout=10) as response:
-                            if response.status == 200:
-                                health_data = await response.json()
-                                node_status.last_health_check = datetime.now()
-                                logger.debug(f"✅ Health check passed: {node_id}")
-                            else:
-                                logger.warning(f"⚠️  Health check failed: {node_id} (HTTP {response.status})")
-                
-                except Exception as e:
-                    logger.warning(f"⚠️  Health check error: {node_id} - {e}")
+        await asyncio.gather(*(
+            self._health_check_node(node_id, node_status)
+            for node_id, node_status in self.nodes.items()
+            if node_status.ho_core_running
+        ))
+    
+    async def _health_check_node(self, node_id: str, node_status: NodeStatus):
+        """Perform health check on a single node"""
+        alive = False
+        try:
+            api_url = f"http://{node_status.ssh_config.host}:{node_status.ssh_config.ho_core_port}"
+            session = await self._session()
+            async with session.get(f"{api_url}/health", timeout=10) as response:
+                if response.status == 200:
+                    alive = True
+                    logger.debug("✅ Health check passed: %s", node_id)
+                else:
+                    logger.warning("⚠️  Health check failed: %s (HTTP %s)", node_id, response.status)
+        
+        except Exception as e:
+            logger.warning("⚠️  Health check error: %s - %s", node_id, e)
+        
+        self._record_heartbeat(node_id, node_status, alive, datetime.now())
     
     async def _initialize_network_coordination(self) -> bool:
         """Initialize network coordination between nodes"""
@@ -672,7 +988,7 @@ class SSHSandloopOrchestrator:
         return True
 
 
-async def main():
+async def main(pretty: bool = False):
     """Main demo execution function"""
     print("🌌 HO-Core SSH Sandloop Demonstration")
     print("=" * 50)
@@ -726,8 +1042,9 @@ async def main():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"sandloop_demo_results_{timestamp}.json"
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # Compact by default; indentation only when asked for
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 if pretty else None))
         
         print(f"\n✅ SSH Sandloop demonstration completed!")
         print(f"📄 Results saved to: {output_file}")
@@ -740,8 +1057,15 @@ async def main():
     except KeyboardInterrupt:
         logger.info("🛑 Demo interrupted by user")
     except Exception as e:
-        logger.error(f"💥 Demo failed: {e}")
+        logger.error("💥 Demo failed: %s", e)
         sys.exit(1)
+    finally:
+        await orchestrator.aclose()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="HO-Core SSH Sandloop Demonstration")
+    parser.add_argument("--pretty", action="store_true", help="Indent the saved results JSON")
+    args = parser.parse_args()
+    asyncio.run(main(pretty=args.pretty))
\ No newline at end of file
@@ -5,14 +5,18 @@ generate_keys.py
 Generate deterministic Ed25519 and secp256k1 key pairs from user‑provided entropy.
 
 Usage:
-    python generate_keys.py <entropy_file_or_hex_string>
+    python generate_keys.py [--raw-seed] <entropy_file_or_hex_string>
+
+    --raw-seed   use the entropy directly as the seed (must be exactly
+                 32 uniformly random bytes) instead of deriving it via HKDF
 """
 
 import sys
 import os
 import binascii
 import base64
-from typing import Tuple, Union
+import re
+from typing import Tuple
 
 # ----------------------------------------------------------------------
 # Crypto imports
@@ -21,29 +25,24 @@ from cryptography.hazmat.primitives.asymmetric import ed25519, ec
 from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 # No backend import needed for recent cryptography versions
-import ecdsa  # pure‑python ECDSA, supports SECP256k1
+import coincurve  # libsecp256k1 bindings
+
+_SECP256K1 = ec.SECP256K1()
+_HEX_ONLY = re.compile(r"\A[0-9a-fA-F]+\Z")
+_DELETE_WHITESPACE = str.maketrans("", "", " \t\r\n")
 
 # ----------------------------------------------------------------------
 # Helper functions
 # ----------------------------------------------------------------------
 
 
-def _to_hex(data: Union[bytes, str]) -> str:
-    """Canonical hex string (lower‑case, no 0x, no whitespace)."""
-    if isinstance(data, bytes):
-        raw = data
-    else:  # str → UTF‑8 bytes
-        raw = data.encode("utf-8")
-    return binascii.hexlify(raw).decode("ascii")
-
-
 def read_entropy(source: str) -> bytes:
     """
     Load entropy from *source* and always return raw bytes.
 
     * file path → raw file contents
     * hex string (with/without 0x) → decoded bytes
-    * anything else → treat as UTF‑8 text, hex‑encode, then decode
+    * anything else → UTF‑8 bytes of the text
     """
     # ---- 1️⃣  File ----------------------------------------------------
     if os.path.isfile(source):
@@ -51,19 +50,16 @@ def read_entropy(source: str) -> bytes:
             data = f.read()
         if not data:
             raise ValueError("Entropy file is empty.")
-        # Run through the canonical hex path for consistency
-        return binascii.unhexlify(_to_hex(data))
+        return data
 
     # ---- 2️⃣  Hex string -----------------------------------------------
-    cleaned = source.strip().replace("0x", "").replace(" ", "")
-    try:
+    cleaned = source.translate(_DELETE_WHITESPACE).replace("0x", "")
+    if len(cleaned) % 2 == 0 and _HEX_ONLY.match(cleaned):
         return binascii.unhexlify(cleaned)
-    except (binascii.Error, ValueError):
-        pass  # not a valid hex → fall through
+    # not a valid hex → fall through
 
     # ---- 3️⃣  Plain‑text fallback ---------------------------------------
-    # Encode as UTF‑8 → hex → bytes
-    return binascii.unhexlify(_to_hex(source))
+    return source.encode("utf-8")
 
 
 def hkdf_derive_seed(
@@ -90,8 +86,8 @@ def hkdf_derive_seed(
 # ----------------------------------------------------------------------
 
 
-def gen_ed25519(seed: bytes) -> Tuple[bytes, bytes]:
-    """Return (private_raw, public_raw) for Ed25519 from a 32‑byte seed."""
+def gen_ed25519(seed: bytes) -> Tuple[ed25519.Ed25519PrivateKey, bytes, bytes]:
+    """Return (private_key, private_raw, public_raw) for Ed25519 from a 32‑byte seed."""
     private_key = ed25519.Ed25519PrivateKey.from_private_bytes(seed)
     public_key = private_key.public_key()
 
@@ -104,12 +100,11 @@ def gen_ed25519(seed: bytes) -> Tuple[bytes, bytes]:
         encoding=serialization.Encoding.Raw,
         format=serialization.PublicFormat.Raw,
     )
-    return priv_raw, pub_raw
+    return private_key, priv_raw, pub_raw
 
 
-def ed25519_pem(private_raw: bytes) -> bytes:
+def ed25519_pem(private_key: ed25519.Ed25519PrivateKey) -> bytes:
     """PEM (PKCS#8) representation of an Ed25519 private key."""
-    private_key = ed25519.Ed25519PrivateKey.from_private_bytes(private_raw)
     return private_key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.PKCS8,
@@ -122,40 +117,34 @@ def ed25519_pem(private_raw: bytes) -> bytes:
 # ----------------------------------------------------------------------
 
 
-def gen_secp256k1(seed: bytes) -> Tuple[bytes, bytes]:
+def gen_secp256k1(seed: bytes) -> Tuple[coincurve.PrivateKey, bytes, bytes]:
     """
-    Return (priv_raw, pub_raw) for secp256k1.
+    Return (private_key, priv_raw, pub_raw) for secp256k1.
     * priv_raw – 32‑byte scalar (big‑endian)
     * pub_raw  – 33‑byte compressed SEC format
     """
-    sk = ecdsa.SigningKey.from_string(seed, curve=ecdsa.SECP256k1)
-    vk = sk.get_verifying_key()
+    sk = coincurve.PrivateKey(seed)
 
-    priv_raw = sk.to_string()                     # 32‑byte scalar
-    pub_raw = vk.to_string("compressed")         # 33‑byte SEC‑compressed
-    return priv_raw, pub_raw
+    priv_raw = sk.secret                                  # 32‑byte scalar
+    pub_raw = sk.public_key.format(compressed=True)      # 33‑byte SEC‑compressed
+    return sk, priv_raw, pub_raw
 
 
-def secp256k1_pem(private_raw: bytes) -> bytes:
-    """PEM (PKCS#8) representation of a secp256k1 private key."""
-    # Build a cryptography EC private key from the scalar:
+def secp256k1_pem(private_key: coincurve.PrivateKey, private_value: int) -> bytes:
+    """
+    PEM (PKCS#8) representation of a secp256k1 private key.
+    *private_value* is the key's scalar as an int (the seed, decoded once).
+    """
+    # Build a cryptography EC private key from the scalar and the already
+    # derived public point, so no scalar multiplication is repeated here
+    x, y = private_key.public_key.point()
     private_numbers = ec.EllipticCurvePrivateNumbers(
-        private_value=int.from_bytes(private_raw, "big"),
-        public_numbers=ec.EllipticCurvePublicNumbers.from_encoded_point(
-            ec.SECP256K1(),
-            # The same compressed point we derived with *ecdsa*
-            private_raw * 0  # dummy – will be replaced below
-        ),
-    )
-    # Replace the dummy point with the real one:
-    signing_key = ecdsa.SigningKey.from_string(private_raw, curve=ecdsa.SECP256k1)
-    compressed = signing_key.get_verifying_key().to_string("compressed")
-    private_numbers.public_numbers = ec.EllipticCurvePublicNumbers.from_encoded_point(
-        ec.SECP256K1(), compressed
+        private_value=private_value,
+        public_numbers=ec.EllipticCurvePublicNumbers(x, y, _SECP256K1),
     )
-    private_key = private_numbers.private_key()
+    crypto_key = private_numbers.private_key()
 
-    return private_key.private_bytes(
+    return crypto_key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.PKCS8,
         encryption_algorithm=serialization.NoEncryption(),
@@ -172,14 +161,17 @@ def b64(b: bytes) -> str:
 
 
 def print_keyset(name: str, priv: bytes, pub: bytes, priv_pem: bytes):
-    print(f"\n=== {name} ===")
-    print(f"Private (hex)   : {priv.hex()}")
-    print(f"Public  (hex)   : {pub.hex()}")
-    print(f"Private (base64): {b64(priv)}")
-    print(f"Public  (base64): {b64(pub)}")
-    print("\n--- PEM ---------------------------------------------------")
-    print(priv_pem.decode().strip())
-    print("-----------------------------------------------------------")
+    # One write for the whole block instead of a print per line
+    sys.stdout.write(
+        f"\n=== {name} ===\n"
+        f"Private (hex)   : {priv.hex()}\n"
+        f"Public  (hex)   : {pub.hex()}\n"
+        f"Private (base64): {b64(priv)}\n"
+        f"Public  (base64): {b64(pub)}\n"
+        "\n--- PEM ---------------------------------------------------\n"
+        f"{priv_pem.decode().strip()}\n"
+        "-----------------------------------------------------------\n"
+    )
 
 
 # ----------------------------------------------------------------------
@@ -188,26 +180,36 @@ def print_keyset(name: str, priv: bytes, pub: bytes, priv_pem: bytes):
 
 
 def main() -> None:
-    if len(sys.argv) != 2:
+    args = sys.argv[1:]
+    raw_seed = "--raw-seed" in args
+    if raw_seed:
+        args.remove("--raw-seed")
+    if len(args) != 1:
         print(__doc__)
         sys.exit(1)
 
     try:
-        entropy = read_entropy(sys.argv[1])
+        entropy = read_entropy(args[0])
     except Exception as exc:
         print(f"Error reading entropy: {exc}", file=sys.stderr)
         sys.exit(2)
 
-    seed = hkdf_derive_seed(entropy)          # 32‑byte uniform seed
+    if raw_seed and len(entropy) != 32:
+        print(f"Error: --raw-seed needs exactly 32 bytes of entropy, got {len(entropy)}.", file=sys.stderr)
+        sys.exit(2)
+
+    # 32‑byte uniform seed; already-uniform input skips HKDF on request
+    seed = entropy if raw_seed else hkdf_derive_seed(entropy)
+    scalar = int.from_bytes(seed, "big")      # decoded once, reused below
 
     # ---- Ed25519 ----------------------------------------------------
-    ed_priv, ed_pub = gen_ed25519(seed)
-    ed_pem = ed25519_pem(ed_priv)
+    ed_key, ed_priv, ed_pub = gen_ed25519(seed)
+    ed_pem = ed25519_pem(ed_key)
     print_keyset("Ed25519", ed_priv, ed_pub, ed_pem)
 
     # ---- secp256k1 --------------------------------------------------
-    secp_priv, secp_pub = gen_secp256k1(seed)
-    secp_pem = secp256k1_pem(secp_priv)
+    secp_key, secp_priv, secp_pub = gen_secp256k1(seed)
+    secp_pem = secp256k1_pem(secp_key, scalar)
     print_keyset("secp256k1 (ECDSA)", secp_priv, secp_pub, secp_pem)
 
 
@@ -24,7 +24,9 @@ python prompt_generator.py --task "Some task" --compact
 """
 
 import argparse
+import functools
 import json
+import os
 import pathlib
 import sys
 from typing import Any, Dict, List, Optional
@@ -32,6 +34,11 @@ from typing import Any, Dict, List, Optional
 import uuid               # <-- needed for UUID generation
 import math               # (used by the golden‑ratio helpers)
  
+try:  # optional fast serializer for orchestrator output
+    import orjson
+except ImportError:
+    orjson = None
+
 SCHEMA_PATH = pathlib.Path(__file__).with_name("schema.json")
 
 # φ – the golden ratio
@@ -39,8 +46,19 @@ PHI = (1 + 5 ** 0.5) / 2          # ≈ 1.618033988749895
 INV_PHI = 1 / PHI                # ≈ 0.6180339887498949
 PHI_TOLERANCE = 0.05      
 
+# Golden-ratio compliance window
+_PHI_LO, _PHI_HI = PHI - PHI_TOLERANCE, PHI + PHI_TOLERANCE
+
+# Precomputed golden-ratio decay weights for the levels we realistically reach
+_GOLDEN_WEIGHTS = tuple(INV_PHI ** i for i in range(64))
+
+# Recursion level → “tetrahedral” role (indexed by level)
+_TETRAHEDRAL_ROLES = ("Coordinator", "Executor", "Referee", "Development")
+
 def _golden_weight(level: int) -> float:
     """Weight that decays with the golden ratio (level 0 → 1.0)."""
+    if 0 <= level < len(_GOLDEN_WEIGHTS):
+        return _GOLDEN_WEIGHTS[level]
     return INV_PHI ** level
 
 def _tetrahedral_position(level: int) -> str:
@@ -48,20 +66,14 @@ def _tetrahedral_position(level: int) -> str:
     Map the recursion level to one of the four “tetrahedral” roles.
     Feel free to adjust the mapping to your own ontology.
     """
-    mapping = {
-        0: "Coordinator",
-        1: "Executor",
-        2: "Referee",
-        3: "Development"
-    }
     # If we go deeper than 3 we simply reuse the last role.
-    return mapping.get(level, "Development")
+    return _TETRAHEDRAL_ROLES[level] if level < len(_TETRAHEDRAL_ROLES) else _TETRAHEDRAL_ROLES[-1]
 
 def _is_golden_ratio_compliant(value: float) -> bool:
     """
     Returns True if *value* lies within a small tolerance of the golden ratio.
     """
-    return abs(value - PHI) <= PHI_TOLERANCE
+    return _PHI_LO <= value <= _PHI_HI
 
  
 
@@ -74,39 +86,69 @@ def load_schema() -> Dict[str, Any]:
         sys.exit(f"❌ Could not read schema at {SCHEMA_PATH}: {exc}")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_validator():
+    """Build the answer-schema validator once; the schema is checked on first use only."""
+    try:
+        from jsonschema.validators import validator_for
+    except ImportError:
+        sys.exit("❌ jsonschema not installed – run `pip install -r requirements.txt` first.")
+
+    schema = load_schema()
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
 # --------------------------------------------------------------------------- #
 #   Meta-prompt and Response Generator
 # --------------------------------------------------------------------------- #
+# Constant scaffolding for build_meta_prompt; per-call fields are filled in on a copy
+_STEP_TEMPLATE = {
+    "step_number": "int",
+    "description": None,
+    "tool": "str(opt)",
+    "condition": "str(opt)",
+    "expected_outcome": "str(opt)"
+}
+
+_META_PROMPT_TEMPLATE = {
+    "instruction": "Generate a prompt for agentic workflow steps in a Recursive Agentic Network.",
+    "purpose": "Define JSON format for autonomous agent actions with recursive support.",
+    "recursion_depth": None,
+    "response_format": None,
+    "example_task": None,
+    "note": None
+}
+
 def build_meta_prompt(task: str, recursion_depth: int = 1) -> Dict[str, Any]:
     """
     Builds a meta-prompt structure for agentic workflows with support for recursion depth.
     Returns a dict that can be used as a prompt for an LLM, optimized for compactness.
     """
-    step_structure = {
-        "step_number": "int",
-        "description": task,
-        "tool": "str(opt)",
-        "condition": "str(opt)",
-        "expected_outcome": "str(opt)"
-    }
+    step_structure = _STEP_TEMPLATE.copy()
+    step_structure["description"] = task
     if recursion_depth > 1:
         step_structure["sub_steps"] = f"arr(depth={recursion_depth-1})"
 
-    return {
-        "instruction": "Generate a prompt for agentic workflow steps in a Recursive Agentic Network.",
-        "purpose": "Define JSON format for autonomous agent actions with recursive support.",
-        "recursion_depth": recursion_depth,
-        "response_format": {
-            "type": "json",
-            "structure": {
-                "task": task,
-                "steps": [step_structure],
-                "final_output": "str"
-            }
-        },
-        "example_task": task,
-        "note": f"Output JSON workflow with nested steps up to depth {recursion_depth}."
+    meta_prompt = _META_PROMPT_TEMPLATE.copy()
+    meta_prompt["recursion_depth"] = recursion_depth
+    meta_prompt["response_format"] = {
+        "type": "json",
+        "structure": {
+            "task": task,
+            "steps": [step_structure],
+            "final_output": "str"
+        }
     }
+    meta_prompt["example_task"] = task
+    meta_prompt["note"] = f"Output JSON workflow with nested steps up to depth {recursion_depth}."
+    return meta_prompt
+
+
+# Agent capabilities, shared by every generated spec (serialized as JSON arrays)
+_ROOT_CAPABILITIES = ("task decomposition", "step execution", "result aggregation")
+_SUB_CAPABILITIES = ("execute subtask", "report to parent")
 
 
 ## TODO: PARSE FROM REQUEST
@@ -127,19 +169,13 @@ def generate_agent_specifications(task_type: str, recursion_depth: int) -> List[
     * **fractal_properties**   ← numeric meta‑data (depth, golden‑ratio
                                  weight, optional “importance”)
     """
-    agents: List[Dict[str, Any]] = []
-
     # ------------------------------------------------------------------
     # Root (level 0) – the primary orchestrator
     # ------------------------------------------------------------------
     root_agent = {
         "agent_id": "agent-0-root",
         "agent_type": task_type,
-        "capabilities": [
-            "task decomposition",
-            "step execution",
-            "result aggregation"
-        ],
+        "capabilities": _ROOT_CAPABILITIES,
         "execution_prompt": "Orchestrate the entire workflow and delegate subtasks.",
         "tetrahedral_position": _tetrahedral_position(0),
         "fractal_properties": {
@@ -148,19 +184,15 @@ def generate_agent_specifications(task_type: str, recursion_depth: int) -> List[
             "importance": 1.0
         }
     }
-    agents.append(root_agent)
 
     # ------------------------------------------------------------------
     # Sub‑agents (depth 1 … recursion_depth)
     # ------------------------------------------------------------------
-    for level in range(1, recursion_depth + 1):
-        sub_agent = {
+    return [root_agent] + [
+        {
             "agent_id": f"agent-{level}-sub",
             "agent_type": f"{task_type}_sub_depth_{level}",
-            "capabilities": [
-                "execute subtask",
-                "report to parent"
-            ],
+            "capabilities": _SUB_CAPABILITIES,
             # A concise prompt that tells the sub‑agent *what* it must do.
             "execution_prompt": f"Execute the portion of the task assigned for depth {level}.",
             "tetrahedral_position": _tetrahedral_position(level),
@@ -172,9 +204,8 @@ def generate_agent_specifications(task_type: str, recursion_depth: int) -> List[
                 "importance": max(0.1, 1.0 - 0.2 * level)
             }
         }
-        agents.append(sub_agent)
-
-    return agents
+        for level in range(1, recursion_depth + 1)
+    ]
 
 def generate_fractal_metadata(
     recursion_depth: int,
@@ -204,7 +235,7 @@ def generate_fractal_metadata(
     fractal_dimension = base_dimension + recursion_depth * dimension_increment
 
     # 2️⃣  Golden‑ratio compliance flag
-    golden_ratio_compliance = _is_golden_ratio_compliant(fractal_dimension)
+    golden_ratio_compliance = _PHI_LO <= fractal_dimension <= _PHI_HI
 
     # 3️⃣  Depth that was actually achieved (just echo the input)
     recursive_depth_achieved = recursion_depth
@@ -261,23 +292,27 @@ def build_meta_prompt_response(request: Dict[str, Any]) -> Dict[str, Any]:
         "orchestration_sequence": orchestration_sequence,
     }
 
+# Shared by every recursive expansion (serialized as a JSON array)
+_TERMINATION_CRITERIA = ("max_depth_reached", "task_completed")
+
 def generate_orchestration_sequence(task_type: str, recursion_depth: int) -> List[Dict[str, Any]]:
     """
     Generates an orchestration sequence based on the task type and recursion depth.
     """
     sequence = []
+    step_ids: List[str] = []   # ids of all earlier steps, grown once per step
     for i in range(recursion_depth):
         step_id = f"step_{i}"
         step_type = "recursive_task" if i < recursion_depth - 1 else "final_task"
         execution_order = i + 1
-        dependencies = [f"step_{j}" for j in range(i)]
+        dependencies = step_ids.copy()
         recursive_expansions = [
             {
                 "expansion_id": f"expansion_{i}",
                 "fractal_level": i + 1,
                 "self_similarity_ratio": 0.5,
                 "expansion_prompt": f"Expand task at level {i + 1}",
-                "termination_criteria": ["max_depth_reached", "task_completed"]
+                "termination_criteria": _TERMINATION_CRITERIA
             }
         ]
         sequence.append({
@@ -287,6 +322,7 @@ def generate_orchestration_sequence(task_type: str, recursion_depth: int) -> Lis
             "dependencies": dependencies,
             "recursive_expansions": recursive_expansions
         })
+        step_ids.append(step_id)
     return sequence
 
 
@@ -307,9 +343,13 @@ def format_generated_prompts(prompts: List[Dict[str, Any]]) -> List[Dict[str, An
     """
     formatted: List[Dict[str, Any]] = []
 
+    # One RNG read for every prompt id instead of one per uuid4() call
+    id_bytes = os.urandom(16 * len(prompts))
+
     for idx, raw in enumerate(prompts):
         # ── id (UUID‑4) ──────────────────────────────────────
-        prompt_id = str(uuid.uuid4())
+        # version=4 sets the version and RFC 4122 variant bits
+        prompt_id = str(uuid.UUID(bytes=id_bytes[idx * 16:(idx + 1) * 16], version=4))
 
         # ── content ────────────────────────────────────────
         # If the caller already supplied a full “content” field we keep it,
@@ -358,17 +398,22 @@ def format_generated_prompts(prompts: List[Dict[str, Any]]) -> List[Dict[str, An
 
 def process_orchestrator_input() -> None:
     """Reads JSON input from stdin (from Rust orchestrator) and generates a compact response."""
-    input_str = sys.stdin.read()
-    if not input_str:
+    stdin = sys.stdin.buffer
+    if not stdin.peek(1):
         sys.exit("❌ No input received from stdin for meta-prompt generation.")
     try:
-        request = json.loads(input_str)
+        # Parse the raw bytes; json detects the UTF encoding itself
+        request = json.load(stdin)
     except json.JSONDecodeError as exc:
         sys.exit(f"❌ Invalid JSON input from stdin: {exc}")
 
     response = build_meta_prompt_response(request)
-    # Output compact JSON for orchestrator use
-    print(json.dumps(response, indent=None, separators=(',', ':'), ensure_ascii=False))
+    # Output compact JSON for orchestrator use, as UTF-8 bytes straight to the stdout buffer
+    if orjson is not None:
+        payload = orjson.dumps(response)
+    else:
+        payload = json.dumps(response, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    sys.stdout.buffer.write(payload + b"\n")
 
 
 # --------------------------------------------------------------------------- #
@@ -384,14 +429,11 @@ def validate_answer(answer_path: pathlib.Path) -> None:
     except Exception as exc:
         sys.exit(f"❌ Could not read answer JSON from {answer_path}: {exc}")
 
-    schema = load_schema()
-    try:
-        from jsonschema import validate, ValidationError
-    except ImportError:
-        sys.exit("❌ jsonschema not installed – run `pip install -r requirements.txt` first.")
+    validator = _get_validator()
+    from jsonschema import ValidationError
 
     try:
-        validate(instance=answer, schema=schema)
+        validator.validate(answer)
         print(f"✅ Validation succeeded – `{answer_path.name}` conforms to the schema.")
     except ValidationError as ve:
         print(f"❌ Validation failed – `{answer_path.name}` does NOT conform to the schema.")
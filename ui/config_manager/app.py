@@ -1,11 +1,12 @@
 """Main Textual application for CW-AGENT configuration manager."""
 
+import functools
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-import toml
+from typing import Optional, Dict, Any, List, Tuple, ClassVar
 import json
 from datetime import datetime
 
+from textual import on
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
 from textual.widgets import Header, Footer, Tree, Label, Static, Button
@@ -13,6 +14,7 @@ from textual.reactive import reactive
 from textual.screen import Screen
 from textual.binding import Binding
 from textual.message import Message
+from textual.timer import Timer
 from rich.text import Text
 
 from models import NodeConfig, APIKeys, SSHConfig
@@ -23,6 +25,34 @@ from utils.backup import BackupManager
 from utils.config_loader import ConfigLoader
 from validation.engine import ValidationEngine
 
+try:  # optional fast serializer for data fingerprints
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _data_fingerprint(data: Any) -> int:
+    """Hash of a config data tree, used to detect unchanged data."""
+    if orjson is not None:
+        return hash(orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS))
+    return hash(json.dumps(data, default=str))
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_for(model_class) -> Dict[str, Any]:
+    """JSON schema for a model class, generated once per class."""
+    return model_class.model_json_schema()
+
+
+@functools.lru_cache(maxsize=None)
+def _section_schema(model_class, section_path: Tuple[str, ...]) -> Dict[str, Any]:
+    """Sub-schema for a section, found by descending through ``properties``."""
+    section_schema = _schema_for(model_class)
+    for key in section_path:
+        if "properties" in section_schema and key in section_schema["properties"]:
+            section_schema = section_schema["properties"][key]
+    return section_schema
+
 
 class ConfigFile:
     """Represents a configuration file type."""
@@ -97,6 +127,17 @@ class ConfigManager(App):
         Binding("f1", "help", "Help", key_display="F1"),
     ]
     
+    # Seconds of editing quiet before re-validating
+    VALIDATE_DEBOUNCE = 0.25
+    
+    # Status label colour per status type
+    _COLOR_MAP: ClassVar[Dict[str, str]] = {
+        "info": "cyan",
+        "success": "green",
+        "warning": "yellow",
+        "error": "red"
+    }
+    
     # Configuration files
     CONFIG_FILES = [
         ConfigFile("config.toml", "config.toml", NodeConfig),
@@ -110,7 +151,18 @@ class ConfigManager(App):
         self.current_file: Optional[ConfigFile] = self.CONFIG_FILES[0]
         self.current_section: Optional[str] = None
         self.current_data: Optional[Dict[str, Any]] = None
+        # Dict in current_data holding the selected section's fields, resolved on first edit
+        self._section_dict: Optional[Dict[str, Any]] = None
+        
+        # Widget references, looked up once on mount
+        self._status_label: Optional[Label] = None
+        self._section_tree: Optional[SectionTree] = None
+        self._field_editor: Optional[FieldEditor] = None
+        self._validation_display: Optional[ValidationDisplay] = None
+        # (model class, data hash) the section tree was last built from
+        self._tree_signature: Optional[Tuple[Any, int]] = None
         self.modified = False
+        self._validate_timer: Optional[Timer] = None
         
         # Initialize managers
         self.backup_manager = BackupManager(config_dir)
@@ -149,6 +201,10 @@ class ConfigManager(App):
     
     async def on_mount(self) -> None:
         """Initialize the application on mount."""
+        self._status_label = self.query_one("#status-label", Label)
+        self._section_tree = self.query_one("#section-tree", SectionTree)
+        self._field_editor = self.query_one("#field-editor", FieldEditor)
+        self._validation_display = self.query_one("#validation-display", ValidationDisplay)
         await self.load_current_file()
         self.update_section_tree()
     
@@ -162,15 +218,27 @@ class ConfigManager(App):
                 self.current_file.filename,
                 self.current_file.model_class
             )
+            self._section_dict = None
             self.modified = False
             await self.update_status("File loaded successfully", "success")
         except Exception as e:
             await self.update_status(f"Error loading file: {str(e)}", "error")
             self.current_data = {}
+            self._section_dict = None
     
     def update_section_tree(self) -> None:
         """Update the section tree based on current file."""
-        tree = self.query_one("#section-tree", SectionTree)
+        tree = self._section_tree
+        
+        # Skip the rebuild when the tree already shows this model and data
+        signature = (
+            self.current_file.model_class,
+            _data_fingerprint(self.current_data or {})
+        )
+        if signature == self._tree_signature:
+            return
+        self._tree_signature = signature
+        
         tree.clear()
         
         if not self.current_data:
@@ -181,18 +249,10 @@ class ConfigManager(App):
     
     async def update_status(self, message: str, status_type: str = "info") -> None:
         """Update the status label."""
-        status_label = self.query_one("#status-label", Label)
-        
         # Apply color based on status type
-        color_map = {
-            "info": "cyan",
-            "success": "green",
-            "warning": "yellow",
-            "error": "red"
-        }
-        color = color_map.get(status_type, "white")
+        color = self._COLOR_MAP.get(status_type, "white")
         
-        status_label.update(Text(f"Status: {message}", style=color))
+        self._status_label.update(Text(f"Status: {message}", style=color))
     
     async def action_save(self) -> None:
         """Save the current configuration."""
@@ -217,10 +277,12 @@ class ConfigManager(App):
                 return
             
             # Save the file
+            # Already validated above, so skip the loader's own model check
             await self.config_loader.save_file(
                 self.current_file.filename,
                 self.current_data,
-                self.current_file.model_class
+                self.current_file.model_class,
+                validate=False
             )
             
             self.modified = False
@@ -236,6 +298,7 @@ class ConfigManager(App):
             return
         
         await self.load_current_file()
+        self.update_section_tree()
         await self.update_status("Changes reset", "success")
     
     async def action_validate(self) -> None:
@@ -243,7 +306,7 @@ class ConfigManager(App):
         if not self.current_data:
             return
         
-        validation_display = self.query_one("#validation-display", ValidationDisplay)
+        validation_display = self._validation_display
         
         # Use validation engine to validate data
         result = self.validation_engine.validate_data(
@@ -252,26 +315,17 @@ class ConfigManager(App):
         )
         
         # Convert validation result to display format
-        validation_items = []
-        for error in result.errors:
-            validation_items.append(ValidationItem(
-                error["field"], error["message"], "error"
-            ))
-        for warning in result.warnings:
-            validation_items.append(ValidationItem(
-                warning["field"], warning["message"], "warning"
-            ))
-        for info in result.info:
-            validation_items.append(ValidationItem(
-                info["field"], info["message"], "info"
-            ))
+        validation_items = [
+            ValidationItem(field, message, level)
+            for level, field, message in result.items()
+        ]
         
         validation_display.update_validation(validation_items)
         
-        if result.errors:
-            await self.update_status(f"{len(result.errors)} validation errors", "error")
-        elif result.warnings:
-            await self.update_status(f"{len(result.warnings)} warnings", "warning")
+        if result.error_count:
+            await self.update_status(f"{result.error_count} validation errors", "error")
+        elif result.warning_count:
+            await self.update_status(f"{result.warning_count} warnings", "warning")
         else:
             await self.update_status("Validation passed", "success")
     
@@ -288,53 +342,57 @@ class ConfigManager(App):
     def on_section_tree_section_selected(self, message: SectionTree.SectionSelected) -> None:
         """Handle section selection from the tree."""
         self.current_section = message.section_path
+        self._section_dict = None
         
         # Update the field editor with the selected section
-        field_editor = self.query_one("#field-editor", FieldEditor)
+        field_editor = self._field_editor
         section_data = self.get_section_data(message.section_path)
         
-        # Convert Pydantic model to JSON schema for the field editor
-        model_schema = self.current_file.model_class.model_json_schema()
-        
-        # Navigate to the correct schema section
-        section_schema = model_schema
-        for key in message.section_path:
-            if "properties" in section_schema and key in section_schema["properties"]:
-                section_schema = section_schema["properties"][key]
+        # JSON schema of the selected section for the field editor (cached per model and path)
+        section_schema = _section_schema(self.current_file.model_class, tuple(message.section_path))
         
         field_editor.update_content(section_data, section_schema, "/".join(message.section_path))
     
     def get_section_data(self, section_path: List[str]) -> Dict[str, Any]:
         """Get data for a specific section path."""
-        data = self.current_data
-        for key in section_path:
-            if isinstance(data, dict) and key in data:
-                data = data[key]
-            else:
-                return {}
+        data = functools.reduce(
+            lambda d, key: d.get(key) if isinstance(d, dict) else None,
+            section_path,
+            self.current_data
+        )
         return data if isinstance(data, dict) else {}
     
+    @on(FieldUpdated)
     def on_field_editor_field_updated(self, message: FieldUpdated) -> None:
         """Handle field changes from the editor."""
         self.modified = True
         
-        # Update the data structure
-        if self.current_section:
-            full_path = self.current_section + [message.field_path]
+        # Update the data structure; the section dict is looked up once per selection.
+        # Typed edits arrive debounced, so one can still belong to the section
+        # the user just left.
+        current_path = self.current_section or []
+        if message.section_path is None or message.section_path == "/".join(current_path):
+            if self._section_dict is None:
+                self._section_dict = self._ensure_section(current_path)
+            section = self._section_dict
         else:
-            full_path = [message.field_path]
-        
-        self.update_field_value(full_path, message.value)
+            section = self._ensure_section(message.section_path.split("/") if message.section_path else [])
+        section[message.field_path] = message.value
         
-        # Run validation
-        self.action_validate()
+        # Run validation once a burst of edits settles
+        if self._validate_timer is not None:
+            self._validate_timer.stop()
+        self._validate_timer = self.set_timer(self.VALIDATE_DEBOUNCE, self.action_validate)
     
-    def update_field_value(self, field_path: List[str], value: Any) -> None:
-        """Update a field value in the data structure."""
+    def _ensure_section(self, section_path: List[str]) -> Dict[str, Any]:
+        """Get the dict at a section path, creating missing levels."""
         data = self.current_data
-        for key in field_path[:-1]:
+        for key in section_path:
             if key not in data:
                 data[key] = {}
             data = data[key]
-        
-        data[field_path[-1]] = value
+        return data
+    
+    def update_field_value(self, field_path: List[str], value: Any) -> None:
+        """Update a field value in the data structure."""
+        self._ensure_section(field_path[:-1])[field_path[-1]] = value
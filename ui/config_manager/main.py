@@ -5,6 +5,7 @@ import sys
 from pathlib import Path
 import click
 from app import ConfigManager
+from utils.config_loader import ConfigLoader
 
 
 @click.command()
@@ -24,10 +25,14 @@ def main(config_dir: Path, debug: bool):
     """CW-AGENT Configuration Manager - A TUI for managing node configurations."""
     app = ConfigManager(config_dir=config_dir)
     
-    if debug:
-        app.run(debug=True)
-    else:
-        app.run()
+    try:
+        if debug:
+            app.run(debug=True)
+        else:
+            app.run()
+    finally:
+        # Let pending saves and backups finish before exiting
+        ConfigLoader.shutdown()
 
 
 if __name__ == "__main__":
@@ -1,38 +1,50 @@
 """API keys configuration schema for api-keys.json."""
 
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator, SecretStr
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator, SecretStr
 import os
 
 
+# Field names whose values are masked in mask_sensitive_data
+SENSITIVE_KEYS = frozenset({"key", "password"})
+
+
 class ProviderAPIKey(BaseModel):
     """Individual provider API key configuration."""
     key: Optional[SecretStr] = Field(None, description="API key (can use env var)")
     env_var: Optional[str] = Field(None, description="Environment variable name")
     endpoint_override: Optional[str] = Field(None, description="Custom endpoint URL")
     
-    @validator('key', pre=True)
-    def resolve_env_var(cls, v, values):
+    @model_validator(mode='before')
+    @classmethod
+    def resolve_env_var(cls, data: Any) -> Any:
         """Resolve environment variable if specified."""
-        if 'env_var' in values and values['env_var']:
-            env_value = os.getenv(values['env_var'])
-            if env_value:
-                return SecretStr(env_value)
-        return v if v else None
+        if not isinstance(data, dict):
+            return data
+        env_var = data.get('env_var')
+        env_value = os.environ.get(env_var) if env_var else None
+        if env_value:
+            # Copy so the caller's raw config never picks up the resolved secret
+            return {**data, 'key': env_value}
+        if 'key' in data and not data['key']:
+            return {**data, 'key': None}
+        return data
     
     def get_key_value(self) -> Optional[str]:
         """Get the actual key value, resolving env vars."""
         if self.env_var:
-            env_value = os.getenv(self.env_var)
+            env_value = os.environ.get(self.env_var)
             if env_value:
                 return env_value
         return self.key.get_secret_value() if self.key else None
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            SecretStr: lambda v: v.get_secret_value() if v else None
-        }
+    model_config = ConfigDict(json_encoders={
+        SecretStr: lambda v: v.get_secret_value() if v else None
+    })
+
+
+# Accepted shapes for a custom provider entry
+_OK_TYPES = (dict, ProviderAPIKey)
 
 
 class OpenAIKeys(ProviderAPIKey):
@@ -74,12 +86,13 @@ class APIKeys(BaseModel):
     llamafile: Optional[LlamafileKeys] = Field(None, description="Llamafile configuration")
     custom: Dict[str, ProviderAPIKey] = Field(default_factory=dict, description="Custom provider keys")
     
-    @validator('custom')
+    @field_validator('custom')
+    @classmethod
     def validate_custom_keys(cls, v):
         """Validate custom provider keys."""
-        for provider_name, config in v.items():
-            if not isinstance(config, (dict, ProviderAPIKey)):
-                raise ValueError(f"Invalid configuration for custom provider {provider_name}")
+        bad = next((name for name, config in v.items() if not isinstance(config, _OK_TYPES)), None)
+        if bad is not None:
+            raise ValueError(f"Invalid configuration for custom provider {bad}")
         return v
     
     def get_provider_config(self, provider_name: str) -> Optional[Any]:
@@ -92,22 +105,26 @@ class APIKeys(BaseModel):
     
     def mask_sensitive_data(self) -> Dict[str, Any]:
         """Return a version of the config with masked sensitive data."""
-        data = self.dict()
+        masked: Dict[str, Any] = {}
         
-        def mask_dict(d: Dict[str, Any]) -> Dict[str, Any]:
-            masked = {}
-            for k, v in d.items():
-                if k in ['key', 'password'] and v:
-                    masked[k] = "***MASKED***"
-                elif isinstance(v, dict):
-                    masked[k] = mask_dict(v)
+        # Walk models and dicts directly (no intermediate dump) with an
+        # explicit stack of (source, destination) pairs
+        stack = [(self, masked)]
+        while stack:
+            src, dst = stack.pop()
+            if isinstance(src, BaseModel):
+                items = ((name, getattr(src, name)) for name in type(src).model_fields)
+            else:
+                items = src.items()
+            for k, v in items:
+                if v and (k in SENSITIVE_KEYS or isinstance(v, SecretStr)):
+                    dst[k] = "***MASKED***"
+                elif isinstance(v, (BaseModel, dict)):
+                    dst[k] = {}
+                    stack.append((v, dst[k]))
                 else:
-                    masked[k] = v
-            return masked
+                    dst[k] = v
         
-        return mask_dict(data)
+        return masked
     
-    class Config:
-        """Pydantic configuration."""
-        validate_assignment = True
-        extra = "forbid"
+    model_config = ConfigDict(validate_assignment=True, extra="forbid")
@@ -1,10 +1,15 @@
 """Node configuration schema for config.toml."""
 
+import re
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
 
+# Exactly 64 hex digits, either case; \Z so a trailing newline is rejected
+_HEX64 = re.compile(r'\A[0-9a-fA-F]{64}\Z')
+
+
 class DeploymentMode(str, Enum):
     """Deployment mode options."""
     LOCAL = "local"
@@ -29,15 +34,17 @@ class ConsensusEngine(str, Enum):
 
 class Identity(BaseModel):
     """Node identity configuration."""
-    node_id: str = Field(..., pattern="^[a-f0-9]{64}$", description="64-char hex node ID")
+    # pattern= also puts the rule in the JSON schema, so the editor checks it live
+    node_id: str = Field(..., pattern="^[0-9a-fA-F]{64}$", description="64-char hex node ID")
     name: str = Field(..., min_length=1, max_length=128, description="Human-readable node name")
     role: str = Field(default="agent", description="Node role in the network")
     tags: List[str] = Field(default_factory=list, description="Node tags for discovery")
     
-    @validator('node_id')
+    @field_validator('node_id')
+    @classmethod
     def validate_node_id(cls, v):
         """Ensure node ID is valid ed25519 public key format."""
-        if len(v) != 64 or not all(c in '0123456789abcdef' for c in v.lower()):
+        if not _HEX64.match(v):
             raise ValueError('Node ID must be 64 hexadecimal characters')
         return v.lower()
 
@@ -59,10 +66,11 @@ class Network(BaseModel):
     enable_dht: bool = Field(default=True, description="Enable distributed hash table")
     max_peers: int = Field(default=50, ge=1, le=1000, description="Maximum peer connections")
     
-    @validator('api_port')
-    def validate_api_port(cls, v, values):
+    @field_validator('api_port')
+    @classmethod
+    def validate_api_port(cls, v, info):
         """Ensure API port doesn't conflict with P2P port."""
-        if 'p2p_port' in values and v == values['p2p_port']:
+        if 'p2p_port' in info.data and v == info.data['p2p_port']:
             raise ValueError('API port and P2P port must be different')
         return v
 
@@ -100,11 +108,12 @@ class LLM(BaseModel):
     default_provider: Optional[str] = Field(None, description="Default provider name")
     fallback_enabled: bool = Field(default=True, description="Enable fallback to other providers")
     
-    @validator('default_provider')
-    def validate_default_provider(cls, v, values):
+    @field_validator('default_provider')
+    @classmethod
+    def validate_default_provider(cls, v, info):
         """Ensure default provider exists in providers list."""
-        if v and 'providers' in values:
-            provider_names = [p.name for p in values['providers']]
+        if v and 'providers' in info.data:
+            provider_names = [p.name for p in info.data['providers']]
             if v not in provider_names:
                 raise ValueError(f'Default provider {v} not found in providers')
         return v
@@ -134,7 +143,4 @@ class NodeConfig(BaseModel):
     llm: LLM = Field(default_factory=LLM)
     sandloop: Sandloop = Field(default_factory=Sandloop)
     
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        validate_assignment = True
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
@@ -1,10 +1,16 @@
 """SSH configuration schema for ssh-config.json."""
 
+import io
 from typing import Optional, List, Dict
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
 
+# OpenSSH config lines that every host block contains, filled via str.format_map
+_SSH_HOST_FMT = "Host {alias}\n  HostName {hostname}\n  Port {port}\n  User {username}"
+_SSH_TIMING_FMT = "  ConnectTimeout {timeout}\n  ServerAliveInterval {keepalive_interval}"
+
+
 class AuthMethod(str, Enum):
     """SSH authentication methods."""
     KEY = "key"
@@ -36,26 +42,29 @@ class SSHHost(BaseModel):
     environment_vars: Dict[str, str] = Field(default_factory=dict, description="Environment variables to set")
     forward_agent: bool = Field(default=False, description="Enable SSH agent forwarding")
     
-    @validator('key_path')
-    def validate_key_path(cls, v, values):
+    @field_validator('key_path')
+    @classmethod
+    def validate_key_path(cls, v, info):
         """Validate key path based on auth method."""
-        auth_method = values.get('auth_method')
+        auth_method = info.data.get('auth_method')
         if auth_method in [AuthMethod.KEY, AuthMethod.KEY_WITH_PASSPHRASE] and not v:
             raise ValueError(f"key_path is required for auth method {auth_method}")
         return v
     
-    @validator('password')
-    def validate_password(cls, v, values):
+    @field_validator('password')
+    @classmethod
+    def validate_password(cls, v, info):
         """Validate password based on auth method."""
-        auth_method = values.get('auth_method')
+        auth_method = info.data.get('auth_method')
         if auth_method == AuthMethod.PASSWORD and not v:
             raise ValueError("password is required for password auth method")
         return v
     
-    @validator('proxy_jump')
-    def validate_proxy_jump(cls, v, values):
+    @field_validator('proxy_jump')
+    @classmethod
+    def validate_proxy_jump(cls, v, info):
         """Ensure proxy jump doesn't reference self."""
-        if v and 'alias' in values and v == values['alias']:
+        if v and 'alias' in info.data and v == info.data['alias']:
             raise ValueError("Host cannot use itself as proxy jump")
         return v
     
@@ -65,30 +74,19 @@ class SSHHost(BaseModel):
     
     def to_ssh_config_format(self) -> str:
         """Convert to OpenSSH config format."""
-        lines = [f"Host {self.alias}"]
-        lines.append(f"  HostName {self.hostname}")
-        lines.append(f"  Port {self.port}")
-        lines.append(f"  User {self.username}")
-        
-        if self.key_path:
-            lines.append(f"  IdentityFile {self.key_path}")
-        
-        if self.compression:
-            lines.append("  Compression yes")
-        
-        lines.append(f"  ConnectTimeout {self.timeout}")
-        lines.append(f"  ServerAliveInterval {self.keepalive_interval}")
+        fields = self.__dict__
+        # One slot per config line in output order; None marks a disabled option
+        lines = [
+            _SSH_HOST_FMT.format_map(fields),
+            f"  IdentityFile {self.key_path}" if self.key_path else None,
+            "  Compression yes" if self.compression else None,
+            _SSH_TIMING_FMT.format_map(fields),
+            "  StrictHostKeyChecking no" if not self.strict_host_key_checking else None,
+            f"  ProxyJump {self.proxy_jump}" if self.proxy_jump else None,
+            "  ForwardAgent yes" if self.forward_agent else None,
+        ]
         
-        if not self.strict_host_key_checking:
-            lines.append("  StrictHostKeyChecking no")
-        
-        if self.proxy_jump:
-            lines.append(f"  ProxyJump {self.proxy_jump}")
-        
-        if self.forward_agent:
-            lines.append("  ForwardAgent yes")
-        
-        return "\n".join(lines)
+        return "\n".join(filter(None, lines))
 
 
 class SSHConfig(BaseModel):
@@ -96,7 +94,8 @@ class SSHConfig(BaseModel):
     hosts: List[SSHHost] = Field(default_factory=list, description="SSH host configurations")
     global_options: Dict[str, str] = Field(default_factory=dict, description="Global SSH options")
     
-    @validator('hosts')
+    @field_validator('hosts')
+    @classmethod
     def validate_unique_aliases(cls, v):
         """Ensure all host aliases are unique."""
         aliases = [host.alias for host in v]
@@ -106,10 +105,8 @@ class SSHConfig(BaseModel):
     
     def get_host_by_alias(self, alias: str) -> Optional[SSHHost]:
         """Get host configuration by alias."""
-        for host in self.hosts:
-            if host.alias == alias:
-                return host
-        return None
+        # hosts is a public, mutable list, so look it up fresh each time
+        return next((host for host in self.hosts if host.alias == alias), None)
     
     def validate_proxy_jumps(self) -> List[str]:
         """Validate all proxy jump references exist."""
@@ -124,22 +121,19 @@ class SSHConfig(BaseModel):
     
     def to_ssh_config_format(self) -> str:
         """Convert entire config to OpenSSH format."""
-        sections = []
+        buf = io.StringIO()
         
         # Add global options if any
         if self.global_options:
             for key, value in self.global_options.items():
-                sections.append(f"{key} {value}")
-            sections.append("")  # Empty line
+                buf.write(f"{key} {value}\n")
+            buf.write("\n")  # Empty line
         
         # Add host configurations
         for host in self.hosts:
-            sections.append(host.to_ssh_config_format())
-            sections.append("")  # Empty line between hosts
+            buf.write(host.to_ssh_config_format())
+            buf.write("\n\n")  # Empty line between hosts
         
-        return "\n".join(sections).strip()
+        return buf.getvalue().strip()
     
-    class Config:
-        """Pydantic configuration."""
-        use_enum_values = True
-        validate_assignment = True
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
@@ -2,9 +2,64 @@
 
 from pathlib import Path
 from datetime import datetime
+from collections import deque
+import os
+import re
 import shutil
 import asyncio
-from typing import List, Optional
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+from .io_pool import run_io, shutdown_io_pool
+
+
+# Backup stem: <original stem>_<YYYYMMDD>_<HHMMSS>
+_TS_RE = re.compile(r"^(?P<stem>.+)_(?P<date>\d{8})_(?P<time>\d{6})$")
+
+# Backup copies at least this large are flushed and evicted from the page cache
+_DROP_CACHE_THRESHOLD = 256 * 1024
+
+
+def _drop_cache(path: Path) -> None:
+    """Flush a file to disk and advise the kernel to drop its cached pages."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Dirty pages are not dropped, so write them back first
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+# Blocking batch helpers; each runs as a single executor job however many files it touches
+
+def _copy_many(pairs: Iterable[Tuple[Path, Path]]) -> None:
+    for src, dst in pairs:
+        shutil.copy2(src, dst)
+
+
+def _backup_many(pairs: Iterable[Tuple[Path, Path]]) -> None:
+    for src, dst in pairs:
+        shutil.copy2(src, dst)
+        # Large backups are rarely read back; keep them out of the page cache
+        if hasattr(os, 'posix_fadvise') and dst.stat().st_size >= _DROP_CACHE_THRESHOLD:
+            _drop_cache(dst)
+
+
+def _unlink_many(paths: Iterable[Path]) -> None:
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def _stamps(paths: Iterable[Optional[Path]]) -> List[Optional[Tuple[int, int]]]:
+    """(size, mtime_ns) per path; None for a missing file or a None path."""
+    stamps = []
+    for path in paths:
+        try:
+            st = os.stat(path) if path is not None else None
+        except FileNotFoundError:
+            st = None
+        stamps.append((st.st_size, st.st_mtime_ns) if st is not None else None)
+    return stamps
 
 
 class BackupManager:
@@ -14,30 +69,73 @@ class BackupManager:
         self.config_dir = Path(config_dir)
         self.backup_dir = backup_dir or (self.config_dir / '.backups')
         self.backup_dir.mkdir(exist_ok=True)
+        # Original filename -> its backups, oldest first; built on first use
+        self._index: Optional[Dict[str, Deque[Path]]] = None
+        self._index_lock = asyncio.Lock()
+    
+    @classmethod
+    def shutdown(cls, wait: bool = True) -> None:
+        """Drain the file I/O pool shared with ConfigLoader."""
+        shutdown_io_pool(wait)
     
     async def create_backup(self, filename: str) -> Path:
         """Create a backup of a configuration file."""
-        source_path = self.config_dir / filename
+        return (await self.create_backups([filename]))[0]
+    
+    async def create_backups(self, filenames: List[str]) -> List[Path]:
+        """Create backups of several configuration files in one batch.
         
-        if not source_path.exists():
-            raise FileNotFoundError(f"Source file {filename} not found")
+        A file whose size and mtime match its newest backup is not copied
+        again; that backup's path is returned instead.
+        """
+        source_paths = [self.config_dir / filename for filename in filenames]
+        async with self._index_lock:
+            index = await self._ensure_index()
+            latest = [index[f][-1] if index.get(f) else None for f in filenames]
         
-        # Generate backup filename with timestamp
+        # copy2 carries the mtime over, so an unchanged source stamps like its newest backup
+        stamps = await run_io(_stamps, source_paths + latest)
+        source_stamps, latest_stamps = stamps[:len(filenames)], stamps[len(filenames):]
+        
+        # Generate backup filenames with a shared timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"{source_path.stem}_{timestamp}{source_path.suffix}"
-        backup_path = self.backup_dir / backup_name
+        backup_paths = []
+        pairs = []
+        copied = []
+        for filename, source_path, source_stamp, latest_path, latest_stamp in zip(
+            filenames, source_paths, source_stamps, latest, latest_stamps
+        ):
+            if source_stamp is None:
+                raise FileNotFoundError(f"Source file {filename} not found")
+            
+            if source_stamp == latest_stamp:
+                backup_paths.append(latest_path)
+                continue
+            
+            backup_name = f"{source_path.stem}_{timestamp}{source_path.suffix}"
+            backup_path = self.backup_dir / backup_name
+            backup_paths.append(backup_path)
+            pairs.append((source_path, backup_path))
+            copied.append(filename)
+        
+        if not pairs:
+            return backup_paths
         
-        # Copy file asynchronously
-        def _copy():
-            shutil.copy2(source_path, backup_path)
+        # Copy all files in a single executor job
+        await run_io(_backup_many, pairs)
         
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, _copy)
+        async with self._index_lock:
+            for filename, (_, backup_path) in zip(copied, pairs):
+                backups = index.setdefault(filename, deque())
+                # A backup taken within the same second overwrote the file in place
+                if backups and backups[-1] == backup_path:
+                    backups.pop()
+                backups.append(backup_path)
         
         # Clean old backups
-        await self._cleanup_old_backups(filename)
+        await self._cleanup_old_backups(copied)
         
-        return backup_path
+        return backup_paths
     
     async def restore_backup(self, backup_filename: str, target_filename: str) -> None:
         """Restore a configuration from backup."""
@@ -52,68 +150,96 @@ class BackupManager:
             await self.create_backup(target_filename)
         
         # Restore from backup
-        def _copy():
-            shutil.copy2(backup_path, target_path)
-        
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, _copy)
+        await run_io(_copy_many, [(backup_path, target_path)])
     
     async def list_backups(self, filename: Optional[str] = None) -> List[Path]:
         """List all backups, optionally filtered by original filename."""
+        base_name = Path(filename).stem if filename else None
+        
         def _list():
-            backups = []
-            for backup_file in self.backup_dir.iterdir():
-                if backup_file.is_file():
-                    if filename:
-                        # Filter by original filename
-                        base_name = Path(filename).stem
-                        if backup_file.name.startswith(base_name):
-                            backups.append(backup_file)
-                    else:
-                        backups.append(backup_file)
+            # scandir hands back file type with each entry, so only the
+            # surviving entries are stat'ed, once each
+            entries = []
+            with os.scandir(self.backup_dir) as it:
+                for entry in it:
+                    if not entry.is_file():
+                        continue
+                    # Filter by original filename
+                    if base_name and not entry.name.startswith(base_name):
+                        continue
+                    entries.append((entry.stat().st_mtime, entry.name))
             
             # Sort by modification time (newest first)
-            return sorted(backups, key=lambda p: p.stat().st_mtime, reverse=True)
+            entries.sort(key=lambda e: e[0], reverse=True)
+            return [self.backup_dir / name for _, name in entries]
         
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _list)
+        return await run_io(_list)
     
     async def delete_backup(self, backup_filename: str) -> None:
         """Delete a specific backup file."""
         backup_path = self.backup_dir / backup_filename
         
-        if not backup_path.exists():
-            raise FileNotFoundError(f"Backup file {backup_filename} not found")
-        
         def _delete():
             backup_path.unlink()
         
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, _delete)
+        # Let unlink report a missing file instead of checking up front
+        try:
+            await run_io(_delete)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Backup file {backup_filename} not found") from None
+        
+        async with self._index_lock:
+            if self._index is not None:
+                backups = self._index.get(self._get_original_filename(backup_path))
+                if backups and backup_path in backups:
+                    backups.remove(backup_path)
+    
+    async def _ensure_index(self) -> Dict[str, Deque[Path]]:
+        """Get the per-file backup index, scanning the backup directory on first use."""
+        if self._index is None:
+            def _scan():
+                with os.scandir(self.backup_dir) as it:
+                    names = sorted(entry.name for entry in it if entry.is_file())
+                # Names share a prefix per original file and end in a fixed-width
+                # timestamp, so name order within a bucket is creation order
+                index: Dict[str, Deque[Path]] = {}
+                for name in names:
+                    path = self.backup_dir / name
+                    index.setdefault(self._get_original_filename(path), deque()).append(path)
+                return index
+            
+            self._index = await run_io(_scan)
+        return self._index
     
-    async def _cleanup_old_backups(self, filename: str, max_backups: int = 10) -> None:
+    async def _cleanup_old_backups(self, filenames: List[str], max_backups: int = 10) -> None:
         """Remove old backups, keeping only the most recent ones."""
-        backups = await self.list_backups(filename)
+        stale = []
+        async with self._index_lock:
+            index = await self._ensure_index()
+            for filename in filenames:
+                backups = index.get(filename)
+                while backups and len(backups) > max_backups:
+                    stale.append(backups.popleft())
         
-        if len(backups) > max_backups:
-            # Delete oldest backups
-            for backup_path in backups[max_backups:]:
-                await self.delete_backup(backup_path.name)
+        if stale:
+            # Delete oldest backups of every file in one executor job
+            await run_io(_unlink_many, stale)
     
     def get_backup_info(self, backup_path: Path) -> dict:
         """Get information about a backup file."""
         stat = backup_path.stat()
         
         # Parse timestamp from filename
-        parts = backup_path.stem.split('_')
-        if len(parts) >= 3:
-            date_str = parts[-2]
-            time_str = parts[-1]
+        m = _TS_RE.match(backup_path.stem)
+        timestamp = None
+        if m:
+            d, t = m.group('date'), m.group('time')
             try:
-                timestamp = datetime.strptime(f"{date_str}_{time_str}", "%Y%m%d_%H%M%S")
+                timestamp = datetime(int(d[:4]), int(d[4:6]), int(d[6:]),
+                                     int(t[:2]), int(t[2:4]), int(t[4:]))
             except ValueError:
-                timestamp = datetime.fromtimestamp(stat.st_mtime)
-        else:
+                pass
+        if timestamp is None:
             timestamp = datetime.fromtimestamp(stat.st_mtime)
         
         return {
@@ -127,7 +253,7 @@ class BackupManager:
     def _get_original_filename(self, backup_path: Path) -> str:
         """Extract original filename from backup filename."""
         # Remove timestamp suffix to get original name
-        parts = backup_path.stem.split('_')[:-2]
-        if parts:
-            return '_'.join(parts) + backup_path.suffix
+        m = _TS_RE.match(backup_path.stem)
+        if m:
+            return m.group('stem') + backup_path.suffix
         return backup_path.name
@@ -1,11 +1,78 @@
 """Configuration file loading and saving utilities."""
 
 from pathlib import Path
-from typing import Dict, Any, Type, Optional
-import toml
-import json
-from pydantic import BaseModel, ValidationError
+from typing import Callable, Dict, Any, List, Tuple, Type, Optional
 import asyncio
+import copy
+import itertools
+import os
+import sys
+import json
+import tomli_w
+from pydantic import BaseModel, SecretStr, ValidationError
+
+from .io_pool import run_io, shutdown_io_pool
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+try:  # optional fast JSON backend
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoder does not handle natively."""
+    if isinstance(obj, SecretStr):
+        return obj.get_secret_value()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Blocking helpers run in a worker thread; each opens, reads/writes and
+# (de)serializes in one hop so the event loop dispatches only once per file
+
+def _parse_toml(raw: bytes) -> Dict[str, Any]:
+    return tomllib.loads(raw.decode('utf-8'))
+
+
+def _parse_json(raw: bytes) -> Dict[str, Any]:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _read_if_changed(
+    file_path: Path,
+    parse: Callable[[bytes], Dict[str, Any]],
+    known: Optional[Tuple[int, int]]
+) -> Tuple[Optional[Tuple[int, int]], Optional[Dict[str, Any]]]:
+    """Return the file's (mtime_ns, size) stamp and its parsed data, or None
+    for the data when the stamp matches known. A missing file gives (None, {})."""
+    try:
+        f = open(file_path, 'rb')
+    except FileNotFoundError:
+        return None, {}
+    with f:
+        st = os.fstat(f.fileno())
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == known:
+            return stamp, None
+        return stamp, parse(f.read())
+
+
+def _write_toml(file_path: Path, data: Dict[str, Any]) -> None:
+    with open(file_path, 'wb') as f:
+        tomli_w.dump(data, f)
+
+
+def _write_json(file_path: Path, data: Dict[str, Any]) -> None:
+    if orjson is not None:
+        payload = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+    with open(file_path, 'wb') as f:
+        f.write(payload)
 
 
 class ConfigLoader:
@@ -13,6 +80,13 @@ class ConfigLoader:
     
     def __init__(self, config_dir: Path):
         self.config_dir = Path(config_dir)
+        # TOML path -> ((mtime_ns, size), parsed data) of the last load
+        self._cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+    
+    @classmethod
+    def shutdown(cls, wait: bool = True) -> None:
+        """Drain the file I/O pool shared with BackupManager."""
+        shutdown_io_pool(wait)
     
     async def load_file(
         self,
@@ -22,15 +96,16 @@ class ConfigLoader:
         """Load a configuration file and optionally validate with model."""
         file_path = self.config_dir / filename
         
-        if not file_path.exists():
-            # Return empty dict for new files
-            return {}
-        
-        # Load based on file extension
+        # Load based on file extension; a missing file (new config) loads as {}.
+        # Only TOML parses are cached: re-parsing JSON is cheaper than the
+        # deepcopy a cache hit needs
         if filename.endswith('.toml'):
-            return await self._load_toml(file_path)
+            return await self._load_cached(file_path, _parse_toml)
         elif filename.endswith('.json'):
-            return await self._load_json(file_path)
+            _, data = await run_io(_read_if_changed, file_path, _parse_json, None)
+            return data
+        elif not file_path.exists():
+            return {}
         else:
             raise ValueError(f"Unsupported file type: {filename}")
     
@@ -38,18 +113,25 @@ class ConfigLoader:
         self,
         filename: str,
         data: Dict[str, Any],
-        model_class: Type[BaseModel]
+        model_class: Type[BaseModel],
+        validate: bool = True
     ) -> None:
-        """Save configuration data to file."""
+        """Save configuration data to file.
+        
+        Pass validate=False when the caller has already validated data.
+        """
         file_path = self.config_dir / filename
         
         # Validate data with model if provided
-        if model_class:
+        if model_class and validate:
             try:
                 model_class(**data)
             except ValidationError as e:
                 raise ValueError(f"Validation error: {e}")
         
+        # Whatever was cached no longer matches the file
+        self.invalidate(filename)
+        
         # Save based on file extension
         if filename.endswith('.toml'):
             await self._save_toml(file_path, data)
@@ -58,52 +140,74 @@ class ConfigLoader:
         else:
             raise ValueError(f"Unsupported file type: {filename}")
     
-    async def _load_toml(self, file_path: Path) -> Dict[str, Any]:
-        """Load TOML file."""
-        def _load():
-            with open(file_path, 'r') as f:
-                return toml.load(f)
-        
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _load)
+    def invalidate(self, filename: str) -> None:
+        """Forget the cached parse of a file, e.g. after an external change."""
+        self._cache.pop(self.config_dir / filename, None)
     
-    async def _load_json(self, file_path: Path) -> Dict[str, Any]:
-        """Load JSON file."""
-        def _load():
-            with open(file_path, 'r') as f:
-                return json.load(f)
-        
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _load)
+    async def _load_cached(
+        self,
+        file_path: Path,
+        parse: Callable[[bytes], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Load a file, reusing the previous parse while its stamp is unchanged."""
+        cached = self._cache.get(file_path)
+        stamp, data = await run_io(_read_if_changed, file_path, parse, cached[0] if cached else None)
+        if stamp is None:
+            # File is gone; forget any earlier parse
+            self._cache.pop(file_path, None)
+        elif data is None:
+            data = cached[1]
+        else:
+            self._cache[file_path] = (stamp, data)
+        # Callers edit the returned dict in place; keep the cached copy pristine
+        return copy.deepcopy(data)
     
     async def _save_toml(self, file_path: Path, data: Dict[str, Any]) -> None:
         """Save TOML file."""
-        def _save():
-            # Convert data to TOML-compatible format
-            toml_data = self._prepare_for_toml(data)
-            with open(file_path, 'w') as f:
-                toml.dump(toml_data, f)
-        
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, _save)
+        # Convert data to TOML-compatible format
+        toml_data = self._prepare_for_toml(data)
+        await run_io(_write_toml, file_path, toml_data)
     
     async def _save_json(self, file_path: Path, data: Dict[str, Any]) -> None:
         """Save JSON file."""
-        def _save():
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
-        
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, _save)
+        await run_io(_write_json, file_path, data)
     
     def _prepare_for_toml(self, data: Any) -> Any:
-        """Prepare data for TOML serialization."""
+        """Prepare data for TOML serialization.
+        
+        Containers that need no change are returned as-is, so only the
+        parts of the tree holding None values or models get copied.
+        """
         if isinstance(data, dict):
-            return {k: self._prepare_for_toml(v) for k, v in data.items()}
+            prepared = None
+            for i, (k, v) in enumerate(data.items()):
+                # TOML has no null; unset values are left out of the file
+                if v is None:
+                    if prepared is None:
+                        prepared = dict(itertools.islice(data.items(), i))
+                    continue
+                new_v = self._prepare_for_toml(v)
+                if prepared is None and new_v is not v:
+                    prepared = dict(itertools.islice(data.items(), i))
+                if prepared is not None:
+                    prepared[k] = new_v
+            return data if prepared is None else prepared
         elif isinstance(data, list):
-            return [self._prepare_for_toml(item) for item in data]
-        elif hasattr(data, 'dict'):  # Pydantic model
-            return self._prepare_for_toml(data.dict())
+            prepared = None
+            for i, item in enumerate(data):
+                # Same for empty array slots (e.g. items of an untyped array)
+                if item is None:
+                    if prepared is None:
+                        prepared = data[:i]
+                    continue
+                new_item = self._prepare_for_toml(item)
+                if prepared is None and new_item is not item:
+                    prepared = data[:i]
+                if prepared is not None:
+                    prepared.append(new_item)
+            return data if prepared is None else prepared
+        elif isinstance(data, BaseModel):
+            return self._prepare_for_toml(data.model_dump())
         else:
             return data
     
@@ -133,3 +237,23 @@ class ConfigLoader:
             return None
         except ValidationError as e:
             return e
+    
+    async def validate_files(
+        self,
+        pairs: List[Tuple[str, Type[BaseModel]]]
+    ) -> List[Optional[Exception]]:
+        """Validate several configuration files concurrently.
+        
+        Results line up with pairs; reads overlap on the I/O pool. A file
+        that cannot be read or parsed gets its load error in its slot
+        instead of failing the whole batch.
+        """
+        results = await asyncio.gather(
+            *(self.validate_file(filename, model_class) for filename, model_class in pairs),
+            return_exceptions=True
+        )
+        for result in results:
+            # Cancellation and the like still propagate
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        return list(results)
@@ -0,0 +1,19 @@
+"""Dedicated thread pool for configuration file I/O."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+# File I/O runs here rather than on the loop's default executor, so it never
+# queues behind blocking work from unrelated libraries
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="cfg-io")
+
+
+async def run_io(func: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking I/O function on the file I/O pool."""
+    return await asyncio.get_running_loop().run_in_executor(_IO_POOL, func, *args)
+
+
+def shutdown_io_pool(wait: bool = True) -> None:
+    """Shut down the file I/O pool, letting queued work finish when wait is true."""
+    _IO_POOL.shutdown(wait=wait)
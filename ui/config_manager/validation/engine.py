@@ -1,34 +1,99 @@
 """Validation engine for configuration data."""
 
-from typing import Any, Dict, List, Optional, Union, Type
-from pydantic import BaseModel, ValidationError
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, Type
+from pydantic import BaseModel, TypeAdapter, ValidationError
+import functools
 import json
+import re
+
+
+# Schema "pattern" strings compiled once each, not per validated value
+_compile_pattern = functools.lru_cache(maxsize=256)(re.compile)
+
+# Field-name substring -> generic suggestions; the first matching rule wins
+_PORT_SUGGESTIONS = ("8080", "3000", "5000", "9000")
+_HOST_SUGGESTIONS = ("localhost", "127.0.0.1", "0.0.0.0")
+_REGION_SUGGESTIONS = ("us-east-1", "us-west-2", "eu-west-1", "ap-southeast-1")
+_SUGGESTION_RULES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("port", _PORT_SUGGESTIONS),
+    ("host", _HOST_SUGGESTIONS),
+    ("region", _REGION_SUGGESTIONS),
+)
 
 
 class ValidationResult:
-    """Result of a validation operation."""
+    """Result of a validation operation.
+    
+    Messages are kept as parallel field/message lists per level; the
+    errors, warnings and info properties build dict views on access.
+    """
     
     def __init__(self):
-        self.errors: List[Dict[str, str]] = []
-        self.warnings: List[Dict[str, str]] = []
-        self.info: List[Dict[str, str]] = []
+        self._error_fields: List[str] = []
+        self._error_messages: List[str] = []
+        self._warning_fields: List[str] = []
+        self._warning_messages: List[str] = []
+        self._info_fields: List[str] = []
+        self._info_messages: List[str] = []
+    
+    @staticmethod
+    def _as_dicts(fields: List[str], messages: List[str]) -> List[Dict[str, str]]:
+        return [{"field": f, "message": m} for f, m in zip(fields, messages)]
+    
+    @property
+    def errors(self) -> List[Dict[str, str]]:
+        """Error entries as field/message dicts (a fresh list per access)."""
+        return self._as_dicts(self._error_fields, self._error_messages)
+    
+    @property
+    def warnings(self) -> List[Dict[str, str]]:
+        """Warning entries as field/message dicts (a fresh list per access)."""
+        return self._as_dicts(self._warning_fields, self._warning_messages)
+    
+    @property
+    def info(self) -> List[Dict[str, str]]:
+        """Info entries as field/message dicts (a fresh list per access)."""
+        return self._as_dicts(self._info_fields, self._info_messages)
+    
+    @property
+    def error_count(self) -> int:
+        """Number of errors."""
+        return len(self._error_fields)
+    
+    @property
+    def warning_count(self) -> int:
+        """Number of warnings."""
+        return len(self._warning_fields)
     
     @property
     def is_valid(self) -> bool:
         """Check if validation passed (no errors)."""
-        return len(self.errors) == 0
+        return not self._error_fields
+    
+    def items(self) -> Iterator[Tuple[str, str, str]]:
+        """Iterate (level, field, message) over errors, then warnings, then info."""
+        for level, fields, messages in (
+            ("error", self._error_fields, self._error_messages),
+            ("warning", self._warning_fields, self._warning_messages),
+            ("info", self._info_fields, self._info_messages),
+        ):
+            for field, message in zip(fields, messages):
+                yield level, field, message
     
     def add_error(self, field: str, message: str) -> None:
         """Add an error message."""
-        self.errors.append({"field": field, "message": message})
+        self._error_fields.append(field)
+        self._error_messages.append(message)
     
     def add_warning(self, field: str, message: str) -> None:
         """Add a warning message."""
-        self.warnings.append({"field": field, "message": message})
+        self._warning_fields.append(field)
+        self._warning_messages.append(message)
     
     def add_info(self, field: str, message: str) -> None:
         """Add an info message."""
-        self.info.append({"field": field, "message": message})
+        self._info_fields.append(field)
+        self._info_messages.append(message)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format."""
@@ -44,15 +109,43 @@ class ValidationEngine:
     """Engine for validating configuration data against schemas."""
     
     def __init__(self):
-        self.model_cache: Dict[str, Type[BaseModel]] = {}
+        # Model class -> TypeAdapter wrapping its compiled validator
+        self.model_cache: Dict[Type[BaseModel], TypeAdapter] = {}
+        # JSON schema "type" -> field validator
+        self._type_handlers: Dict[str, Callable[[str, Any, Dict[str, Any], ValidationResult], None]] = {
+            "string": self._validate_string,
+            "integer": self._validate_integer,
+            "number": self._validate_number,
+            "boolean": self._validate_boolean,
+            "array": self._validate_array,
+            "object": self._validate_object,
+        }
+        # Model class name -> best-practice checks, and the per-class lookup memo
+        self._practices_by_name: Dict[str, Callable[[Dict[str, Any], ValidationResult], None]] = {
+            "NodeConfig": self._check_node_config_practices,
+            "LLMConfig": self._check_llm_config_practices,
+            "StorageConfig": self._check_storage_config_practices,
+        }
+        self._practices_by_model: Dict[type, Optional[Callable[[Dict[str, Any], ValidationResult], None]]] = {}
+        # (model class, field name) -> value suggestions
+        self._suggest_cache: Dict[Tuple[Type[BaseModel], str], List[str]] = {}
+        # id(enum list) -> (enum list, membership set)
+        self._enum_sets: Dict[int, Tuple[List[Any], Any]] = {}
+    
+    def _get_validator(self, model_class: Type[BaseModel]) -> TypeAdapter:
+        """Get the validator for a model class, building it on first use."""
+        validator = self.model_cache.get(model_class)
+        if validator is None:
+            validator = self.model_cache[model_class] = TypeAdapter(model_class)
+        return validator
     
     def validate_data(self, data: Dict[str, Any], model_class: Type[BaseModel]) -> ValidationResult:
         """Validate data against a Pydantic model."""
         result = ValidationResult()
         
         try:
-            # Attempt to create model instance
-            instance = model_class(**data)
+            # Attempt to validate into a model instance
+            instance = self._get_validator(model_class).validate_python(data)
             
             # If successful, perform additional checks
             self._check_best_practices(data, model_class, result)
@@ -69,7 +162,11 @@ class ValidationEngine:
     def validate_json_schema(self, data: Dict[str, Any], schema: Dict[str, Any]) -> ValidationResult:
         """Validate data against a JSON schema."""
         result = ValidationResult()
-        
+        self._walk(data, schema, "", result)
+        return result
+    
+    def _walk(self, data: Dict[str, Any], schema: Dict[str, Any], prefix: str, result: ValidationResult) -> None:
+        """Validate an object against its schema, reporting fields under prefix."""
         # Basic type checking
         properties = schema.get("properties", {})
         required = schema.get("required", [])
@@ -77,15 +174,14 @@ class ValidationEngine:
         # Check required fields
         for field in required:
             if field not in data or data[field] is None:
-                result.add_error(field, "This field is required")
+                result.add_error(f"{prefix}.{field}" if prefix else field, "This field is required")
         
         # Validate each field
         for field_name, field_value in data.items():
             if field_name in properties:
                 field_schema = properties[field_name]
-                self._validate_field(field_name, field_value, field_schema, result)
-        
-        return result
+                path = f"{prefix}.{field_name}" if prefix else field_name
+                self._validate_field(path, field_value, field_schema, result)
     
     def _validate_field(self, name: str, value: Any, schema: Dict[str, Any], result: ValidationResult) -> None:
         """Validate a single field against its schema."""
@@ -98,72 +194,94 @@ class ValidationEngine:
             return
         
         # Type validation
-        if field_type == "string":
-            if not isinstance(value, str):
-                result.add_error(name, "Must be a string")
-                return
-            
-            # String constraints
-            if "minLength" in schema and len(value) < schema["minLength"]:
-                result.add_error(name, f"Must be at least {schema['minLength']} characters")
-            
-            if "maxLength" in schema and len(value) > schema["maxLength"]:
-                result.add_error(name, f"Must be at most {schema['maxLength']} characters")
-            
-            if "pattern" in schema:
-                import re
-                if not re.match(schema["pattern"], value):
-                    result.add_error(name, f"Does not match required pattern")
-            
-            if "enum" in schema and value not in schema["enum"]:
-                result.add_error(name, f"Must be one of: {', '.join(schema['enum'])}")
+        handler = self._type_handlers.get(field_type)
+        if handler is not None:
+            handler(name, value, schema, result)
+    
+    def _enum_set(self, enum: List[Any]) -> Union[frozenset, List[Any]]:
+        """Get a set for O(1) membership tests on a schema's enum list."""
+        entry = self._enum_sets.get(id(enum))
+        # Keep the list alongside its set so a recycled id() never matches
+        if entry is None or entry[0] is not enum:
+            try:
+                entry = (enum, frozenset(enum))
+            except TypeError:  # unhashable enum members
+                entry = (enum, enum)
+            self._enum_sets[id(enum)] = entry
+        return entry[1]
+    
+    def _validate_string(self, name: str, value: Any, schema: Dict[str, Any], result: ValidationResult) -> None:
+        """Validate a string field and its constraints."""
+        if not isinstance(value, str):
+            result.add_error(name, "Must be a string")
+            return
         
-        elif field_type == "integer":
-            if not isinstance(value, int) or isinstance(value, bool):
-                result.add_error(name, "Must be an integer")
-                return
-            
-            self._validate_numeric_constraints(name, value, schema, result)
+        # String constraints
+        keys = schema.keys()
+        length = len(value)
+        if "minLength" in keys and length < schema["minLength"]:
+            result.add_error(name, f"Must be at least {schema['minLength']} characters")
         
-        elif field_type == "number":
-            if not isinstance(value, (int, float)) or isinstance(value, bool):
-                result.add_error(name, "Must be a number")
-                return
-            
-            self._validate_numeric_constraints(name, value, schema, result)
+        if "maxLength" in keys and length > schema["maxLength"]:
+            result.add_error(name, f"Must be at most {schema['maxLength']} characters")
         
-        elif field_type == "boolean":
-            if not isinstance(value, bool):
-                result.add_error(name, "Must be a boolean")
+        if "pattern" in keys:
+            if not _compile_pattern(schema["pattern"]).match(value):
+                result.add_error(name, f"Does not match required pattern")
         
-        elif field_type == "array":
-            if not isinstance(value, list):
-                result.add_error(name, "Must be an array")
-                return
-            
-            # Array constraints
-            if "minItems" in schema and len(value) < schema["minItems"]:
-                result.add_error(name, f"Must have at least {schema['minItems']} items")
-            
-            if "maxItems" in schema and len(value) > schema["maxItems"]:
-                result.add_error(name, f"Must have at most {schema['maxItems']} items")
-            
-            # Validate array items
-            if "items" in schema:
-                for i, item in enumerate(value):
-                    self._validate_field(f"{name}[{i}]", item, schema["items"], result)
+        if "enum" in keys and value not in self._enum_set(schema["enum"]):
+            result.add_error(name, f"Must be one of: {', '.join(schema['enum'])}")
+    
+    def _validate_integer(self, name: str, value: Any, schema: Dict[str, Any], result: ValidationResult) -> None:
+        """Validate an integer field and its constraints."""
+        if not isinstance(value, int) or isinstance(value, bool):
+            result.add_error(name, "Must be an integer")
+            return
         
-        elif field_type == "object":
-            if not isinstance(value, dict):
-                result.add_error(name, "Must be an object")
-                return
-            
-            # Validate nested object
-            if "properties" in schema:
-                nested_result = self.validate_json_schema(value, schema)
-                for error in nested_result.errors:
-                    error["field"] = f"{name}.{error['field']}"
-                    result.errors.append(error)
+        self._validate_numeric_constraints(name, value, schema, result)
+    
+    def _validate_number(self, name: str, value: Any, schema: Dict[str, Any], result: ValidationResult) -> None:
+        """Validate a numeric field and its constraints."""
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            result.add_error(name, "Must be a number")
+            return
+        
+        self._validate_numeric_constraints(name, value, schema, result)
+    
+    def _validate_boolean(self, name: str, value: Any, schema: Dict[str, Any], result: ValidationResult) -> None:
+        """Validate a boolean field."""
+        if not isinstance(value, bool):
+            result.add_error(name, "Must be a boolean")
+    
+    def _validate_array(self, name: str, value: Any, schema: Dict[str, Any], result: ValidationResult) -> None:
+        """Validate an array field, its constraints and its items."""
+        if not isinstance(value, list):
+            result.add_error(name, "Must be an array")
+            return
+        
+        # Array constraints
+        keys = schema.keys()
+        if "minItems" in keys and len(value) < schema["minItems"]:
+            result.add_error(name, f"Must have at least {schema['minItems']} items")
+        
+        if "maxItems" in keys and len(value) > schema["maxItems"]:
+            result.add_error(name, f"Must have at most {schema['maxItems']} items")
+        
+        # Validate array items
+        if "items" in keys:
+            item_schema = schema["items"]
+            for i, item in enumerate(value):
+                self._validate_field(f"{name}[{i}]", item, item_schema, result)
+    
+    def _validate_object(self, name: str, value: Any, schema: Dict[str, Any], result: ValidationResult) -> None:
+        """Validate a nested object field."""
+        if not isinstance(value, dict):
+            result.add_error(name, "Must be an object")
+            return
+        
+        # Validate nested object straight into the caller's result
+        if "properties" in schema:
+            self._walk(value, schema, name, result)
     
     def _validate_numeric_constraints(self, name: str, value: Union[int, float], 
                                     schema: Dict[str, Any], result: ValidationResult) -> None:
@@ -187,15 +305,12 @@ class ValidationEngine:
                             result: ValidationResult) -> None:
         """Check for configuration best practices."""
         # Golden ratio checks
-        if hasattr(model_class, "__name__"):
-            model_name = model_class.__name__
-            
-            if model_name == "NodeConfig":
-                self._check_node_config_practices(data, result)
-            elif model_name == "LLMConfig":
-                self._check_llm_config_practices(data, result)
-            elif model_name == "StorageConfig":
-                self._check_storage_config_practices(data, result)
+        try:
+            check = self._practices_by_model[model_class]
+        except KeyError:
+            check = self._practices_by_model[model_class] = self._practices_by_name.get(model_class.__name__)
+        if check is not None:
+            check(data, result)
     
     def _check_node_config_practices(self, data: Dict[str, Any], result: ValidationResult) -> None:
         """Check Node configuration best practices."""
@@ -224,17 +339,22 @@ class ValidationEngine:
     
     def _check_llm_config_practices(self, data: Dict[str, Any], result: ValidationResult) -> None:
         """Check LLM configuration best practices."""
-        if "providers" in data and isinstance(data["providers"], list):
-            if len(data["providers"]) == 0:
+        providers = data.get("providers")
+        if isinstance(providers, list):
+            if not providers:
                 result.add_warning("providers", "No LLM providers configured")
             
-            # Check for duplicate providers
-            provider_names = [p.get("name") for p in data["providers"] if "name" in p]
-            if len(provider_names) != len(set(provider_names)):
-                result.add_warning("providers", "Duplicate provider names detected")
-            
-            # Check provider configurations
-            for i, provider in enumerate(data["providers"]):
+            # Duplicate names and per-provider checks share a single pass
+            seen = set()
+            duplicate_warned = False
+            for i, provider in enumerate(providers):
+                if "name" in provider and not duplicate_warned:
+                    name = provider["name"]
+                    if name in seen:
+                        result.add_warning("providers", "Duplicate provider names detected")
+                        duplicate_warned = True
+                    seen.add(name)
+                
                 if "model" in provider and provider["model"]:
                     model = provider["model"]
                     if "gpt-4" in model and "max_tokens" in provider:
@@ -265,11 +385,20 @@ class ValidationEngine:
     def get_field_suggestions(self, field_name: str, current_value: Any, 
                             model_class: Type[BaseModel]) -> List[str]:
         """Get suggestions for a field value."""
+        key = (model_class, field_name)
+        suggestions = self._suggest_cache.get(key)
+        if suggestions is None:
+            suggestions = self._suggest_cache[key] = self._build_field_suggestions(field_name, model_class)
+        # Callers get their own list; the cached one stays intact
+        return list(suggestions)
+    
+    def _build_field_suggestions(self, field_name: str, model_class: Type[BaseModel]) -> List[str]:
+        """Work out suggestions for a field from its model annotation and name."""
         suggestions = []
         
         # Get field info from model
-        if hasattr(model_class, "__fields__"):
-            fields = model_class.__fields__
+        fields = getattr(model_class, "model_fields", None)
+        if fields:
             if field_name in fields:
                 field_info = fields[field_name]
                 
@@ -282,11 +411,10 @@ class ValidationEngine:
                             suggestions.extend([member.value for member in arg])
         
         # Common suggestions based on field name
-        if "port" in field_name.lower():
-            suggestions.extend(["8080", "3000", "5000", "9000"])
-        elif "host" in field_name.lower():
-            suggestions.extend(["localhost", "127.0.0.1", "0.0.0.0"])
-        elif "region" in field_name.lower():
-            suggestions.extend(["us-east-1", "us-west-2", "eu-west-1", "ap-southeast-1"])
+        field_name_lower = field_name.lower()
+        for needle, values in _SUGGESTION_RULES:
+            if needle in field_name_lower:
+                suggestions.extend(values)
+                break
         
         return suggestions
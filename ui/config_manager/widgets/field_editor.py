@@ -1,23 +1,74 @@
 """Field editor widget for editing configuration values."""
 
-from typing import Any, Optional, Dict, List, Union
+from typing import Any, Callable, Optional, Dict, List, Set, Tuple, Union
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll, Horizontal, Container
 from textual.widgets import Static, Input, Switch, Label, Button
 from textual.widget import Widget
 from textual.reactive import reactive
 from textual.message import Message
+from textual.timer import Timer
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
+from .labels import display_title
+
+
+# Rendered value for a numeric field whose text doesn't parse; equal to no
+# data value, so the next rebuild always patches the widget
+_UNPARSED = object()
+
+
+def _text_input(name: str, value: Any, input_type: str = "text") -> Widget:
+    """Create the Input for a string field."""
+    input_widget = Input(
+        value=str(value or ""),
+        id=f"field_{name}",
+        classes="field-input",
+        type=input_type
+    )
+    input_widget.field_name = name
+    return input_widget
+
+
+def _number_input(name: str, value: Any) -> Widget:
+    """Create the Input for an integer or number field."""
+    return _text_input(name, value, "number")
+
+
+def _switch_input(name: str, value: Any) -> Widget:
+    """Create the Switch for a boolean field."""
+    input_widget = Switch(
+        value=bool(value),
+        id=f"field_{name}",
+        classes="field-input"
+    )
+    input_widget.field_name = name
+    return input_widget
+
+
+# JSON schema type -> (field name, value) -> input widget, for the scalar types
+_INPUT_FACTORIES: Dict[str, Callable[[str, Any], Widget]] = {
+    "string": _text_input,
+    "integer": _number_input,
+    "number": _number_input,
+    "boolean": _switch_input,
+}
+
 
 class FieldUpdated(Message):
-    """Message emitted when a field is updated."""
+    """Message emitted when a field is updated.
     
-    def __init__(self, field_path: str, value: Any) -> None:
+    section_path is the editor path the edit was made under (None: whatever
+    section is current); typed edits are posted after a short debounce, by
+    which time another section may be shown.
+    """
+    
+    def __init__(self, field_path: str, value: Any, section_path: Optional[str] = None) -> None:
         super().__init__()
         self.field_path = field_path
         self.value = value
+        self.section_path = section_path
 
 
 class FieldEditor(Widget):
@@ -30,6 +81,7 @@ class FieldEditor(Widget):
     }
     
     .field-container {
+        height: auto;
         padding: 1;
         margin-bottom: 1;
     }
@@ -53,7 +105,12 @@ class FieldEditor(Widget):
         margin-top: 1;
     }
     
+    .array-container {
+        height: auto;
+    }
+    
     .array-item {
+        height: auto;
         margin-bottom: 1;
         padding: 1;
         border: solid $primary;
@@ -62,113 +119,325 @@ class FieldEditor(Widget):
     .required-field {
         color: $warning;
     }
+    
+    .field-placeholder {
+        height: 3;
+        margin-bottom: 1;
+    }
     """
     
     current_data = reactive({})
     current_schema = reactive({})
     current_path = reactive("")
     
+    # Seconds of typing quiet before edits are posted as FieldUpdated
+    UPDATE_DEBOUNCE = 0.12
+    
+    # Schemas with more fields than this mount a field only near the viewport
+    LAZY_FIELD_THRESHOLD = 40
+    # Lines beyond the viewport within which fields are mounted; twice this
+    # distance away they are swapped back for placeholders
+    LAZY_MARGIN = 10
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Mounted widget per field, plus what it was built from, so a rebuild
+        # only touches the fields whose schema or value changed
+        self._field_widgets: Dict[str, Widget] = {}
+        self._field_state: Dict[str, tuple] = {}
+        self._array_items: Dict[str, List[Widget]] = {}
+        self._placeholder: Optional[Static] = None
+        # Lazy mode: fields currently shown as fixed-height placeholders
+        self._lazy = False
+        self._unmounted_fields: Set[str] = set()
+        # Placeholders from a rebuild that have not been laid out yet; the
+        # visibility check is retried until they have a region
+        self._unplaced_fields: Set[str] = set()
+        # Widget factory per (field name, id of its schema), valid for the current schema
+        self._factory_cache: Dict[Tuple[str, int], Callable[[Any, bool], Optional[Widget]]] = {}
+        # Typed values not yet posted, latest per field
+        self._pending_updates: Dict[str, Any] = {}
+        self._debounce_timer: Optional[Timer] = None
+        # The field scroll container, looked up once on mount
+        self._scroll: Optional[VerticalScroll] = None
+    
     def compose(self) -> ComposeResult:
         """Create the field editor layout."""
         yield VerticalScroll(id="field-scroll")
     
+    def on_mount(self) -> None:
+        """Cache the scroll container and track its scrolling for lazy mode."""
+        self._scroll = self.query_one("#field-scroll", VerticalScroll)
+        self.watch(self._scroll, "scroll_y", self._mount_visible_fields, init=False)
+    
+    def on_resize(self) -> None:
+        """A taller editor can bring placeholders into view."""
+        if self._lazy:
+            self.call_after_refresh(self._mount_visible_fields)
+    
     def update_content(self, data: Dict[str, Any], schema: Dict[str, Any], path: str = "") -> None:
         """Update the editor with new data and schema."""
+        # Re-selecting the section on show: its widgets already reflect this
+        # data, since edits land in the same dict
+        if data is self.current_data and schema is self.current_schema and path == self.current_path:
+            return
+        
+        # Edits typed into the outgoing section are posted under its path
+        self._flush_pending()
+        if schema is not self.current_schema:
+            self._factory_cache.clear()
         self.current_data = data
         self.current_schema = schema
         self.current_path = path
         self._rebuild_fields()
     
     def _rebuild_fields(self) -> None:
-        """Rebuild all field widgets based on current data and schema."""
-        scroll = self.query_one("#field-scroll", VerticalScroll)
-        scroll.remove_children()
+        """Bring the field widgets in line with current data and schema.
+        
+        Widgets are diffed against the registry: fields that left the schema
+        are removed, fields with a new schema or required flag are rebuilt,
+        and fields whose value alone changed are patched in place.
+        """
+        scroll = self._scroll
         
         if not self.current_schema:
-            scroll.mount(Static("No schema available"))
+            for field_name in list(self._field_widgets):
+                self._drop_field(field_name)
+            if self._placeholder is None:
+                self._placeholder = Static("No schema available")
+                scroll.mount(self._placeholder)
             return
         
+        if self._placeholder is not None:
+            self._placeholder.remove()
+            self._placeholder = None
+        
         # Get the properties from the schema
         properties = self.current_schema.get("properties", {})
-        required_fields = self.current_schema.get("required", [])
+        required_fields = set(self.current_schema.get("required") or ())
+        self._lazy = len(properties) > self.LAZY_FIELD_THRESHOLD
         
-        # Create field widgets
+        for field_name in [name for name in self._field_widgets if name not in properties]:
+            self._drop_field(field_name)
+        
+        # New widgets are collected into runs and each run is mounted at once
+        # after the kept widget that precedes it, so schema order is kept
+        previous: Optional[Widget] = None
+        new_widgets: List[Widget] = []
         for field_name, field_schema in properties.items():
             field_value = self.current_data.get(field_name)
-            field_widget = self._create_field_widget(
-                field_name, 
-                field_schema, 
-                field_value,
-                field_name in required_fields
-            )
+            required = field_name in required_fields
+            rendered = tuple(field_value) if isinstance(field_value, list) else field_value
+            
+            field_widget = self._field_widgets.get(field_name)
+            state = self._field_state.get(field_name)
+            if field_widget is not None and state[0] is field_schema and state[1] == required:
+                if state[2] != rendered:
+                    self._patch_field(field_name, field_value)
+                    self._field_state[field_name] = (field_schema, required, rendered)
+                self._mount_fields(new_widgets, previous)
+                new_widgets = []
+                previous = field_widget
+                continue
+            
+            if field_widget is not None:
+                self._drop_field(field_name)
+            
+            if self._lazy:
+                field_widget = self._create_field_placeholder(field_name)
+                self._unmounted_fields.add(field_name)
+                self._unplaced_fields.add(field_name)
+            else:
+                field_widget = self._create_field_widget(
+                    field_name, 
+                    field_schema, 
+                    field_value,
+                    required
+                )
             if field_widget:
-                scroll.mount(field_widget)
+                new_widgets.append(field_widget)
+                self._field_widgets[field_name] = field_widget
+                self._field_state[field_name] = (field_schema, required, rendered)
+        self._mount_fields(new_widgets, previous)
+        
+        if self._lazy:
+            # Regions are known only after layout
+            self.call_after_refresh(self._mount_visible_fields)
+        else:
+            for field_name in list(self._unmounted_fields):
+                self._swap_in_field(field_name)
     
-    def _create_field_widget(self, name: str, schema: Dict[str, Any], value: Any, required: bool) -> Optional[Widget]:
-        """Create appropriate widget based on field type."""
-        field_type = schema.get("type", "string")
-        description = schema.get("description", "")
+    def _mount_fields(self, widgets: List[Widget], previous: Optional[Widget]) -> None:
+        """Mount a run of new field widgets right after previous, or first."""
+        if not widgets:
+            return
+        if previous is not None:
+            self._scroll.mount_all(widgets, after=previous)
+        else:
+            self._scroll.mount_all(widgets, before=0)
+    
+    def _drop_field(self, field_name: str) -> None:
+        """Unmount a field's widget and forget it."""
+        self._field_widgets.pop(field_name).remove()
+        self._field_state.pop(field_name, None)
+        self._array_items.pop(field_name, None)
+        self._unmounted_fields.discard(field_name)
+        self._unplaced_fields.discard(field_name)
+    
+    def _create_field_placeholder(self, field_name: str) -> Widget:
+        """Create the stand-in shown for a field that is far from view."""
+        return Static(display_title(field_name), classes="field-placeholder")
+    
+    def _mount_visible_fields(self) -> None:
+        """Swap placeholders near the viewport for real widgets, and back again far from it."""
+        if not self._lazy:
+            return
         
-        container = Container(classes="field-container")
+        window = self._scroll.window_region
+        near = window.grow((self.LAZY_MARGIN, 0, self.LAZY_MARGIN, 0))
+        far = window.grow((2 * self.LAZY_MARGIN, 0, 2 * self.LAZY_MARGIN, 0))
+        focused = self.screen.focused
         
-        # Label
-        label_text = name.replace("_", " ").title()
-        if required:
-            label_text += " *"
-        label = Label(label_text, classes="field-label")
-        if required:
-            label.add_class("required-field")
+        changed = False
+        unplaced = self._unplaced_fields
+        for field_name, field_widget in list(self._field_widgets.items()):
+            region = field_widget.virtual_region
+            if not region:
+                continue  # Not laid out yet
+            unplaced.discard(field_name)
+            if field_name in self._unmounted_fields:
+                if region.overlaps(near):
+                    self._swap_in_field(field_name)
+                    changed = True
+            elif not region.overlaps(far) and not (
+                focused is not None and field_widget in focused.ancestors_with_self
+            ):
+                self._swap_out_field(field_name)
+                changed = True
         
-        # Create input based on type
-        if field_type == "string":
-            if "enum" in schema:
-                # TODO: Implement dropdown for enum values
-                input_widget = self._create_enum_input(name, schema["enum"], value)
+        if changed or (unplaced and window):
+            # Swapped widgets change height, which can expose more placeholders;
+            # new placeholders get a region on the next layout of a visible
+            # scroll (a hidden one is picked up by on_resize)
+            self.call_after_refresh(self._mount_visible_fields)
+    
+    def _swap_in_field(self, field_name: str) -> None:
+        """Replace a field's placeholder with its real widget."""
+        placeholder = self._field_widgets[field_name]
+        schema, required, _ = self._field_state[field_name]
+        field_widget = self._create_field_widget(
+            field_name, schema, self.current_data.get(field_name), required
+        )
+        self._scroll.mount(field_widget, after=placeholder)
+        placeholder.remove()
+        self._field_widgets[field_name] = field_widget
+        self._unmounted_fields.discard(field_name)
+        self._unplaced_fields.discard(field_name)
+    
+    def _swap_out_field(self, field_name: str) -> None:
+        """Replace a field's real widget with a placeholder."""
+        field_widget = self._field_widgets[field_name]
+        placeholder = self._create_field_placeholder(field_name)
+        self._scroll.mount(placeholder, after=field_widget)
+        field_widget.remove()
+        self._field_widgets[field_name] = placeholder
+        self._array_items.pop(field_name, None)
+        self._unmounted_fields.add(field_name)
+    
+    def _patch_field(self, field_name: str, value: Any) -> None:
+        """Update a mounted field widget to show a new value."""
+        if field_name in self._array_items:
+            self._sync_array_items(field_name, value or [])
+            return
+        
+        input_widget = getattr(self._field_widgets[field_name], "input_widget", None)
+        if isinstance(input_widget, Switch):
+            with input_widget.prevent(Switch.Changed):
+                input_widget.value = bool(value)
+        elif isinstance(input_widget, Input):
+            options = getattr(input_widget, "enum_options", None)
+            if options is not None:
+                text = str(value or options[0]) if options else ""
             else:
-                input_widget = Input(
-                    value=str(value or ""),
-                    id=f"field_{name}",
-                    classes="field-input"
-                )
-                input_widget.field_name = name
+                text = str(value or "")
+            # Programmatic update, not an edit: don't echo it back as FieldUpdated
+            with input_widget.prevent(Input.Changed):
+                input_widget.value = text
+    
+    def _sync_array_items(self, array_name: str, values: List[Any]) -> None:
+        """Patch, append or drop array item widgets to match values."""
+        items = self._array_items[array_name]
+        field_schema = self.current_schema.get("properties", {}).get(array_name, {})
+        item_schema = field_schema.get("items", {})
         
-        elif field_type == "integer" or field_type == "number":
-            input_widget = Input(
-                value=str(value or ""),
-                id=f"field_{name}",
-                classes="field-input",
-                type="number"
-            )
-            input_widget.field_name = name
+        for item_widget, value in zip(items, values):
+            input_widget = getattr(item_widget, "input_widget", None)
+            if isinstance(input_widget, Input):
+                input_widget.value = str(value or "")
         
-        elif field_type == "boolean":
-            input_widget = Switch(
-                value=bool(value),
-                id=f"field_{name}",
-                classes="field-input"
-            )
-            input_widget.field_name = name
+        if len(items) < len(values):
+            new_items = [
+                self._create_array_item(array_name, i, values[i], item_schema)
+                for i in range(len(items), len(values))
+            ]
+            items.extend(new_items)
+            self._field_widgets[array_name].array_container.mount_all(new_items)
+        
+        while len(items) > len(values):
+            items.pop().remove()
+    
+    def _create_field_widget(self, name: str, schema: Dict[str, Any], value: Any, required: bool) -> Optional[Widget]:
+        """Create appropriate widget based on field type."""
+        key = (name, id(schema))
+        factory = self._factory_cache.get(key)
+        if factory is None:
+            factory = self._factory_cache[key] = self._compile_field(name, schema)
+        return factory(value, required)
+    
+    def _compile_field(self, name: str, schema: Dict[str, Any]) -> Callable[[Any, bool], Optional[Widget]]:
+        """Read a field schema once and return a factory for its widget.
+        
+        The factory takes (value, required), so later rebuilds skip the type
+        dispatch and schema lookups.
+        """
+        field_type = schema.get("type", "string")
+        description = schema.get("description", "")
+        label_base = display_title(name)
         
-        elif field_type == "array":
-            return self._create_array_widget(name, schema, value or [], required)
+        if field_type == "array":
+            return lambda value, required: self._create_array_widget(name, schema, value or [], required)
         
-        elif field_type == "object":
+        if field_type == "object":
             # TODO: Handle nested objects
-            return Static(f"Object field: {name} (not yet implemented)")
+            return lambda value, required: Static(f"Object field: {name} (not yet implemented)")
         
+        # Create input based on type
+        if field_type == "string" and "enum" in schema:
+            # TODO: Implement dropdown for enum values
+            options = schema["enum"]
+            make_input = lambda name, value: self._create_enum_input(name, options, value)
         else:
-            return Static(f"Unsupported field type: {field_type}")
+            make_input = _INPUT_FACTORIES.get(field_type) if isinstance(field_type, str) else None
+            if make_input is None:
+                return lambda value, required: Static(f"Unsupported field type: {field_type}")
         
-        # Build the container
-        with container:
-            with Horizontal():
-                container.mount(label)
-                container.mount(input_widget)
+        def build(value: Any, required: bool) -> Widget:
+            # Label
+            label = Label(f"{label_base} *" if required else label_base, classes="field-label")
+            if required:
+                label.add_class("required-field")
             
+            # Build the container
+            input_widget = make_input(name, value)
+            children = [Horizontal(label, input_widget)]
             if description:
-                container.mount(Static(description, classes="field-description"))
+                children.append(Static(description, classes="field-description"))
+            
+            container = Container(*children, classes="field-container")
+            container.input_widget = input_widget
+            return container
         
-        return container
+        return build
     
     def _create_enum_input(self, name: str, options: List[str], value: Any) -> Widget:
         """Create a dropdown-like input for enum values."""
@@ -186,63 +455,55 @@ class FieldEditor(Widget):
     
     def _create_array_widget(self, name: str, schema: Dict[str, Any], values: List[Any], required: bool) -> Widget:
         """Create widget for array editing."""
-        container = Container(classes="field-container")
-        
-        label_text = name.replace("_", " ").title()
+        label_text = display_title(name)
         if required:
             label_text += " *"
         
-        with container:
-            label = Label(label_text, classes="field-label")
-            if required:
-                label.add_class("required-field")
-            container.mount(label)
-            
-            # Array items container
-            array_container = Container(id=f"array_{name}", classes="array-container")
-            
-            # Add existing items
-            for i, item in enumerate(values):
-                item_widget = self._create_array_item(name, i, item, schema.get("items", {}))
-                array_container.mount(item_widget)
-            
-            container.mount(array_container)
-            
-            # Add/Remove buttons
-            with container:
-                controls = Horizontal(classes="array-controls")
-                controls.mount(Button("Add Item", id=f"add_{name}", variant="primary"))
-                controls.mount(Button("Remove Last", id=f"remove_{name}", variant="warning"))
-                container.mount(controls)
+        label = Label(label_text, classes="field-label")
+        if required:
+            label.add_class("required-field")
+        
+        # Array items container, kept with its items so add/remove touch one item
+        item_widgets = [
+            self._create_array_item(name, i, item, schema.get("items", {}))
+            for i, item in enumerate(values)
+        ]
+        array_container = Container(*item_widgets, id=f"array_{name}", classes="array-container")
+        self._array_items[name] = item_widgets
+        
+        # Add/Remove buttons
+        controls = Horizontal(
+            Button("Add Item", id=f"add_{name}", variant="primary"),
+            Button("Remove Last", id=f"remove_{name}", variant="warning"),
+            classes="array-controls"
+        )
         
+        container = Container(label, array_container, controls, classes="field-container")
+        container.array_container = array_container
         return container
     
     def _create_array_item(self, array_name: str, index: int, value: Any, item_schema: Dict[str, Any]) -> Widget:
         """Create widget for a single array item."""
         item_type = item_schema.get("type", "string")
         
-        container = Container(classes="array-item")
-        with container:
-            container.mount(Label(f"Item {index + 1}"))
-            
-            if item_type == "string":
-                input_widget = Input(
-                    value=str(value or ""),
-                    id=f"field_{array_name}_{index}",
-                    classes="field-input"
-                )
-            elif item_type in ["integer", "number"]:
-                input_widget = Input(
-                    value=str(value or ""),
-                    id=f"field_{array_name}_{index}",
-                    classes="field-input",
-                    type="number"
-                )
-            else:
-                input_widget = Static(f"Unsupported array item type: {item_type}")
-            
-            container.mount(input_widget)
+        if item_type == "string":
+            input_widget = Input(
+                value=str(value or ""),
+                id=f"field_{array_name}_{index}",
+                classes="field-input"
+            )
+        elif item_type in ["integer", "number"]:
+            input_widget = Input(
+                value=str(value or ""),
+                id=f"field_{array_name}_{index}",
+                classes="field-input",
+                type="number"
+            )
+        else:
+            input_widget = Static(f"Unsupported array item type: {item_type}")
         
+        container = Container(Label(f"Item {index + 1}"), input_widget, classes="array-item")
+        container.input_widget = input_widget
         return container
     
     async def on_input_changed(self, event: Input.Changed) -> None:
@@ -260,23 +521,46 @@ class FieldEditor(Widget):
                     try:
                         value = int(value) if value else None
                     except ValueError:
+                        self._set_rendered(field_name, _UNPARSED)
                         return  # Invalid input
                 elif field_type == "number":
                     try:
                         value = float(value) if value else None
                     except ValueError:
+                        self._set_rendered(field_name, _UNPARSED)
                         return  # Invalid input
             
-            # Update data and emit message
+            # Update data now; the message waits until typing pauses
             self.current_data[field_name] = value
-            self.post_message(FieldUpdated(field_name, value))
+            self._set_rendered(field_name, value)
+            self._pending_updates[field_name] = value
+            if self._debounce_timer is not None:
+                self._debounce_timer.stop()
+            self._debounce_timer = self.set_timer(self.UPDATE_DEBOUNCE, self._flush_pending)
+    
+    def _set_rendered(self, field_name: str, rendered: Any) -> None:
+        """Record the value a field's widget now shows after a user edit."""
+        state = self._field_state.get(field_name)
+        if state is not None:
+            self._field_state[field_name] = (state[0], state[1], rendered)
+    
+    def _flush_pending(self) -> None:
+        """Post one FieldUpdated per field typed into since the last flush."""
+        if self._debounce_timer is not None:
+            self._debounce_timer.stop()
+            self._debounce_timer = None
+        
+        pending, self._pending_updates = self._pending_updates, {}
+        for field_name, value in pending.items():
+            self.post_message(FieldUpdated(field_name, value, self.current_path))
     
     async def on_switch_changed(self, event: Switch.Changed) -> None:
         """Handle switch changes."""
         if hasattr(event.switch, "field_name"):
             field_name = event.switch.field_name
             self.current_data[field_name] = event.value
-            self.post_message(FieldUpdated(field_name, event.value))
+            self._set_rendered(field_name, event.value)
+            self.post_message(FieldUpdated(field_name, event.value, self.current_path))
     
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses for array management."""
@@ -310,13 +594,24 @@ class FieldEditor(Widget):
         else:
             self.current_data[array_name].append(None)
         
-        # Rebuild the array widget
-        self._rebuild_fields()
-        self.post_message(FieldUpdated(array_name, self.current_data[array_name]))
+        # Mount just the new item when the array is on screen
+        self._refresh_array(array_name)
+        self.post_message(FieldUpdated(array_name, self.current_data[array_name], self.current_path))
     
     async def _remove_array_item(self, array_name: str) -> None:
         """Remove the last item from an array field."""
         if array_name in self.current_data and self.current_data[array_name]:
             self.current_data[array_name].pop()
+            self._refresh_array(array_name)
+            self.post_message(FieldUpdated(array_name, self.current_data[array_name], self.current_path))
+    
+    def _refresh_array(self, array_name: str) -> None:
+        """Reflect an in-place change to an array field's data."""
+        if array_name not in self._array_items:
             self._rebuild_fields()
-            self.post_message(FieldUpdated(array_name, self.current_data[array_name]))
+            return
+        
+        values = self.current_data[array_name]
+        self._sync_array_items(array_name, values)
+        schema, required, _ = self._field_state[array_name]
+        self._field_state[array_name] = (schema, required, tuple(values))
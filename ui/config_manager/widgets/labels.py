@@ -0,0 +1,16 @@
+"""Display labels shared by the configuration widgets."""
+
+import functools
+
+
+# "_" → " " in one translate pass
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+
+@functools.lru_cache(maxsize=1024)
+def display_title(name: str) -> str:
+    """Turn a field or key name into a title, e.g. "api_port" → "Api Port".
+    
+    Cached per name, since the same names recur on every tree and form rebuild.
+    """
+    return name.translate(_UNDERSCORE_TO_SPACE).title()
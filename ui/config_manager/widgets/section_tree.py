@@ -1,11 +1,18 @@
 """Section tree widget for navigating configuration sections."""
 
 from typing import Dict, Any, List, Optional, Type
+from weakref import WeakKeyDictionary
 from textual.widgets import Tree
 from textual.message import Message
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
+from .labels import display_title
+
+
+# Model class → {field name: nested model type or None}; weak so throwaway model classes can be collected
+_MODEL_FIELD_CACHE: "WeakKeyDictionary[type, Dict[str, Optional[Type[BaseModel]]]]" = WeakKeyDictionary()
+
 
 class SectionTree(Tree):
     """Tree widget for configuration sections."""
@@ -19,33 +26,48 @@ class SectionTree(Tree):
     
     def __init__(self, *args, **kwargs):
         super().__init__("Configuration", *args, **kwargs)
-        self.section_paths: Dict[int, List[str]] = {}
     
     def build_from_data(self, data: Dict[str, Any], model_class: Type[BaseModel]) -> None:
         """Build tree from configuration data and model."""
         self.clear()
-        self.section_paths.clear()
         
         root = self.root
         root.expand()
         
         # Build tree structure based on model fields
-        if hasattr(model_class, '__fields__'):
-            for field_name, field in model_class.__fields__.items():
-                if field_name in data:
-                    self._add_section_node(root, field_name, field, data[field_name], [field_name])
+        for field_name, nested_model in self._resolved_fields(model_class).items():
+            if field_name in data:
+                self._add_section_node(root, field_name, data[field_name], [field_name], True, nested_model)
+    
+    def _resolved_fields(self, model_class: Type[BaseModel]) -> Dict[str, Optional[Type[BaseModel]]]:
+        """Get each model field's nested model type, resolved once per class."""
+        fields = _MODEL_FIELD_CACHE.get(model_class)
+        if fields is None:
+            fields = {}
+            if hasattr(model_class, '__fields__'):
+                fields = {
+                    field_name: self._get_nested_model_type(field)
+                    for field_name, field in model_class.__fields__.items()
+                }
+            _MODEL_FIELD_CACHE[model_class] = fields
+        return fields
     
     def _add_section_node(
         self,
         parent_node,
         name: str,
-        field: Optional[FieldInfo],
         value: Any,
-        path: List[str]
+        path: List[str],
+        is_field: bool = False,
+        nested_model: Optional[Type[BaseModel]] = None
     ) -> None:
-        """Add a section node to the tree."""
+        """Add a section node to the tree.
+        
+        Dict values are only expanded for model fields (is_field), using the
+        field's nested model when it has one.
+        """
         # Create display name
-        display_name = name.replace('_', ' ').title()
+        display_name = display_title(name)
         
         # Add type indicator
         if isinstance(value, dict):
@@ -56,30 +78,28 @@ class SectionTree(Tree):
         else:
             icon = "📄"
         
-        node = parent_node.add(f"{icon} {display_name}")
-        node_id = id(node)
-        self.section_paths[node_id] = path.copy()
+        # The node carries its own section path as data
+        node = parent_node.add(f"{icon} {display_name}", data=path.copy())
         
         # Handle nested structures
-        if isinstance(value, dict) and field:
-            # Try to get nested model type
-            nested_model = self._get_nested_model_type(field)
-            if nested_model and hasattr(nested_model, '__fields__'):
-                for sub_name, sub_field in nested_model.__fields__.items():
+        if isinstance(value, dict) and is_field:
+            if nested_model is not None:
+                for sub_name, sub_model in self._resolved_fields(nested_model).items():
                     if sub_name in value:
                         sub_path = path + [sub_name]
                         self._add_section_node(
                             node,
                             sub_name,
-                            sub_field,
                             value[sub_name],
-                            sub_path
+                            sub_path,
+                            True,
+                            sub_model
                         )
             else:
                 # Just add dict keys
                 for key, val in value.items():
                     sub_path = path + [key]
-                    self._add_section_node(node, key, None, val, sub_path)
+                    self._add_section_node(node, key, val, sub_path)
         
         elif isinstance(value, list) and len(value) > 0:
             # Add list items
@@ -89,7 +109,7 @@ class SectionTree(Tree):
                     item_name = item['name']
                 
                 sub_path = path + [str(i)]
-                self._add_section_node(node, item_name, None, item, sub_path)
+                self._add_section_node(node, item_name, item, sub_path)
     
     def _get_nested_model_type(self, field: FieldInfo) -> Optional[Type[BaseModel]]:
         """Extract nested model type from field."""
@@ -116,7 +136,6 @@ class SectionTree(Tree):
     
     def on_tree_node_highlighted(self, event: Tree.NodeHighlighted) -> None:
         """Handle node selection."""
-        node_id = id(event.node)
-        if node_id in self.section_paths:
-            path = self.section_paths[node_id]
+        path = event.node.data
+        if path is not None:
             self.post_message(self.SectionSelected(path))
@@ -1,6 +1,7 @@
 """Validation display widget for showing validation errors and warnings."""
 
-from typing import List, Dict, Any, Optional
+import functools
+from typing import List, Dict, Any, Callable, FrozenSet, Optional, Set, Tuple
 from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.widgets import Static, Label
@@ -10,10 +11,65 @@ from rich.text import Text
 from rich.console import Group
 from rich.panel import Panel
 
+from validation.engine import _compile_pattern
+
+
+# Level -> (icon, icon style, widget class) for a message line
+_LEVEL_STYLES = {
+    "error": ("✗ ", "bold red", "validation-error"),
+    "warning": ("⚠ ", "bold yellow", "validation-warning"),
+    "info": ("ℹ ", "bold blue", "validation-info"),
+}
+
+# Validation messages; the templates are filled from schema constraints
+_MSG_REQUIRED = "This field is required"
+_MSG_NOT_STRING = "Must be a string"
+_MSG_NOT_INTEGER = "Must be an integer"
+_MSG_NOT_NUMBER = "Must be a number"
+_MSG_NOT_BOOLEAN = "Must be true or false"
+_MSG_NOT_ARRAY = "Must be an array"
+_MSG_NAME_CHARS = "Consider using only letters, numbers, underscores, and hyphens"
+_MSG_ONE_OF = "Must be one of: {}"
+_MSG_MIN_LENGTH = "Must be at least {} characters"
+_MSG_MAX_LENGTH = "Must be at most {} characters"
+_MSG_PATTERN = "Does not match required pattern: {}"
+_MSG_MINIMUM = "Must be at least {}"
+_MSG_MAXIMUM = "Must be at most {}"
+_MSG_MIN_ITEMS = "Must have at least {} items"
+_MSG_MAX_ITEMS = "Must have at most {} items"
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _format_message(template: str, arg: Any) -> str:
+    """Fill a message template; the same schema bounds recur on every validation.
+    
+    typed=True keeps e.g. a minimum of 1 and 1.0 from sharing an entry.
+    """
+    return template.format(arg)
+
+
+def _to_int(value: Any) -> int:
+    """int(value), skipping the conversion for a value that is already an int."""
+    return value if isinstance(value, int) and not isinstance(value, bool) else int(value)
+
+
+def _to_float(value: Any) -> float:
+    """float(value), skipping the conversion for a value that is already a float."""
+    return value if isinstance(value, float) else float(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _one_of_message(options: Tuple[str, ...]) -> str:
+    """Message listing a field's enum options."""
+    return _MSG_ONE_OF.format(", ".join(options))
+
 
 class ValidationItem:
     """Represents a single validation issue."""
     
+    # Many are created per validation run; no per-instance __dict__
+    __slots__ = ("field", "message", "level")
+    
     def __init__(self, field: str, message: str, level: str = "error"):
         self.field = field
         self.message = message
@@ -23,6 +79,134 @@ class ValidationItem:
         return f"[{self.level}] {self.field}: {self.message}"
 
 
+@functools.lru_cache(maxsize=256)
+def _required_item(field_name: str) -> ValidationItem:
+    """The shared "required" error for a field; items are never modified after creation."""
+    return ValidationItem(field_name, _MSG_REQUIRED, "error")
+
+
+def _val_string(field_name: str, value: Any, field_schema: Dict[str, Any], items: List[ValidationItem]) -> None:
+    """Check a string value's type, enum and length/pattern constraints."""
+    if not isinstance(value, str):
+        items.append(ValidationItem(field_name, _MSG_NOT_STRING, "error"))
+    
+    # Check enum values
+    if "enum" in field_schema and value not in field_schema["enum"]:
+        items.append(ValidationItem(
+            field_name, 
+            _one_of_message(tuple(field_schema["enum"])), 
+            "error"
+        ))
+    
+    # Check string constraints
+    if "minLength" in field_schema and len(value) < field_schema["minLength"]:
+        items.append(ValidationItem(
+            field_name,
+            _format_message(_MSG_MIN_LENGTH, field_schema["minLength"]),
+            "error"
+        ))
+    
+    if "maxLength" in field_schema and len(value) > field_schema["maxLength"]:
+        items.append(ValidationItem(
+            field_name,
+            _format_message(_MSG_MAX_LENGTH, field_schema["maxLength"]),
+            "error"
+        ))
+    
+    # Pattern validation
+    if "pattern" in field_schema:
+        pattern = field_schema["pattern"]
+        if not _compile_pattern(pattern).match(value):
+            items.append(ValidationItem(
+                field_name,
+                _format_message(_MSG_PATTERN, pattern),
+                "error"
+            ))
+
+
+def _val_integer(field_name: str, value: Any, field_schema: Dict[str, Any], items: List[ValidationItem]) -> None:
+    """Check that a value parses as an integer within its bounds."""
+    try:
+        int_value = _to_int(value)
+        
+        # Check numeric constraints
+        if "minimum" in field_schema and int_value < field_schema["minimum"]:
+            items.append(ValidationItem(
+                field_name,
+                _format_message(_MSG_MINIMUM, field_schema["minimum"]),
+                "error"
+            ))
+        
+        if "maximum" in field_schema and int_value > field_schema["maximum"]:
+            items.append(ValidationItem(
+                field_name,
+                _format_message(_MSG_MAXIMUM, field_schema["maximum"]),
+                "error"
+            ))
+    except (ValueError, TypeError):
+        items.append(ValidationItem(field_name, _MSG_NOT_INTEGER, "error"))
+
+
+def _val_number(field_name: str, value: Any, field_schema: Dict[str, Any], items: List[ValidationItem]) -> None:
+    """Check that a value parses as a number within its bounds."""
+    try:
+        float_value = _to_float(value)
+        
+        # Check numeric constraints
+        if "minimum" in field_schema and float_value < field_schema["minimum"]:
+            items.append(ValidationItem(
+                field_name,
+                _format_message(_MSG_MINIMUM, field_schema["minimum"]),
+                "error"
+            ))
+        
+        if "maximum" in field_schema and float_value > field_schema["maximum"]:
+            items.append(ValidationItem(
+                field_name,
+                _format_message(_MSG_MAXIMUM, field_schema["maximum"]),
+                "error"
+            ))
+    except (ValueError, TypeError):
+        items.append(ValidationItem(field_name, _MSG_NOT_NUMBER, "error"))
+
+
+def _val_boolean(field_name: str, value: Any, field_schema: Dict[str, Any], items: List[ValidationItem]) -> None:
+    """Check that a value is a boolean."""
+    if not isinstance(value, bool):
+        items.append(ValidationItem(field_name, _MSG_NOT_BOOLEAN, "error"))
+
+
+def _val_array(field_name: str, value: Any, field_schema: Dict[str, Any], items: List[ValidationItem]) -> None:
+    """Check that a value is a list within its item-count bounds."""
+    if not isinstance(value, list):
+        items.append(ValidationItem(field_name, _MSG_NOT_ARRAY, "error"))
+    else:
+        # Check array constraints
+        if "minItems" in field_schema and len(value) < field_schema["minItems"]:
+            items.append(ValidationItem(
+                field_name,
+                _format_message(_MSG_MIN_ITEMS, field_schema["minItems"]),
+                "error"
+            ))
+        
+        if "maxItems" in field_schema and len(value) > field_schema["maxItems"]:
+            items.append(ValidationItem(
+                field_name,
+                _format_message(_MSG_MAX_ITEMS, field_schema["maxItems"]),
+                "error"
+            ))
+
+
+# JSON schema type -> checks for a present value; each appends its issues to items
+_VALIDATORS: Dict[str, Callable[[str, Any, Dict[str, Any], List[ValidationItem]], None]] = {
+    "string": _val_string,
+    "integer": _val_integer,
+    "number": _val_number,
+    "boolean": _val_boolean,
+    "array": _val_array,
+}
+
+
 class ValidationDisplay(Widget):
     """Widget to display validation errors and warnings."""
     
@@ -66,39 +250,86 @@ class ValidationDisplay(Widget):
     }
     """
     
-    validation_items = reactive([])
     is_valid = reactive(True)
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Current validation items, changed in place
+        self._items: List[ValidationItem] = []
+        # The mounted Static per level; each renders all of that level's lines
+        self._level_widgets: Dict[str, Static] = {}
+        # Last schema seen by validate_field and its "required" list as a set;
+        # validate_all passes the same schema for every field
+        self._required_memo: Tuple[Optional[Dict[str, Any]], FrozenSet[str]] = (None, frozenset())
+        # The message scroll container, looked up once on mount
+        self._scroll: Optional[VerticalScroll] = None
+    
     def compose(self) -> ComposeResult:
         """Create the validation display layout."""
         yield Label("Validation Results", classes="validation-header")
         yield VerticalScroll(id="validation-scroll", classes="validation-scroll")
     
+    def on_mount(self) -> None:
+        """Cache the scroll container."""
+        self._scroll = self.query_one("#validation-scroll", VerticalScroll)
+    
+    @property
+    def validation_items(self) -> List[ValidationItem]:
+        """The validation items currently shown."""
+        return self._items
+    
     def update_validation(self, items: List[ValidationItem]) -> None:
         """Update the validation display with new items."""
-        self.validation_items = items
+        self._items[:] = items
         self.is_valid = not any(item.level == "error" for item in items)
         self._rebuild_display()
     
     def clear_validation(self) -> None:
         """Clear all validation messages."""
-        self.validation_items = []
+        self._items.clear()
         self.is_valid = True
         self._rebuild_display()
     
     def add_validation(self, field: str, message: str, level: str = "error") -> None:
         """Add a single validation item."""
         item = ValidationItem(field, message, level)
-        self.validation_items = list(self.validation_items) + [item]
-        self.is_valid = not any(item.level == "error" for item in self.validation_items)
-        self._rebuild_display()
+        had_items = bool(self._items)
+        self._items.append(item)
+        if level == "error":
+            self.is_valid = False
+        
+        if had_items:
+            self._rebuild_display_incremental({level})
+        else:
+            self._rebuild_display()
+    
+    def _items_by_level(self) -> Tuple[List[ValidationItem], List[ValidationItem], List[ValidationItem]]:
+        """Split the current items into errors, warnings and infos."""
+        errors, warnings, infos = [], [], []
+        dispatch = {"error": errors.append, "warning": warnings.append, "info": infos.append}
+        # One pass; items with an unknown level are not displayed
+        for item in self._items:
+            append = dispatch.get(item.level)
+            if append is not None:
+                append(item)
+        return errors, warnings, infos
+    
+    def _format_line(self, item: ValidationItem) -> Text:
+        """Format one item as an icon, field and message line."""
+        icon, icon_style, _ = _LEVEL_STYLES[item.level]
+        return Text.assemble((icon, icon_style), (f"{item.field}: ", "bold"), item.message)
+    
+    def _level_group(self, items: List[ValidationItem]) -> Group:
+        """Render a level's items as one group of lines."""
+        return Group(*[self._format_line(item) for item in items])
     
     def _rebuild_display(self) -> None:
         """Rebuild the validation display."""
-        scroll = self.query_one("#validation-scroll", VerticalScroll)
+        scroll = self._scroll
         scroll.remove_children()
+        self._level_widgets = {}
         
-        if not self.validation_items:
+        if not self._items:
             # Show success message if no issues
             success_msg = Static(
                 "✓ All fields are valid",
@@ -107,167 +338,71 @@ class ValidationDisplay(Widget):
             scroll.mount(success_msg)
             return
         
-        # Group items by level
-        errors = [item for item in self.validation_items if item.level == "error"]
-        warnings = [item for item in self.validation_items if item.level == "warning"]
-        infos = [item for item in self.validation_items if item.level == "info"]
-        
-        # Display errors first
-        if errors:
-            for error in errors:
-                error_text = Text()
-                error_text.append("✗ ", style="bold red")
-                error_text.append(f"{error.field}: ", style="bold")
-                error_text.append(error.message)
-                
-                error_widget = Static(error_text, classes="validation-error")
-                scroll.mount(error_widget)
-        
-        # Then warnings
-        if warnings:
-            for warning in warnings:
-                warning_text = Text()
-                warning_text.append("⚠ ", style="bold yellow")
-                warning_text.append(f"{warning.field}: ", style="bold")
-                warning_text.append(warning.message)
-                
-                warning_widget = Static(warning_text, classes="validation-warning")
-                scroll.mount(warning_widget)
-        
-        # Finally info messages
-        if infos:
-            for info in infos:
-                info_text = Text()
-                info_text.append("ℹ ", style="bold blue")
-                info_text.append(f"{info.field}: ", style="bold")
-                info_text.append(info.message)
+        # Errors first, then warnings, finally info messages; one widget per level
+        for level, items in zip(_LEVEL_STYLES, self._items_by_level()):
+            if items:
+                self._level_widgets[level] = Static(
+                    self._level_group(items), classes=_LEVEL_STYLES[level][2]
+                )
+        scroll.mount_all(self._level_widgets.values())
+    
+    def _rebuild_display_incremental(self, levels: Set[str]) -> None:
+        """Re-render only the given levels' widgets, leaving the others as they are."""
+        scroll = self._scroll
+        previous: Optional[Static] = None
+        for level, items in zip(_LEVEL_STYLES, self._items_by_level()):
+            level_widget = self._level_widgets.get(level)
+            if level in levels:
+                if not items:
+                    if level_widget is not None:
+                        del self._level_widgets[level]
+                        level_widget.remove()
+                    continue
                 
-                info_widget = Static(info_text, classes="validation-info")
-                scroll.mount(info_widget)
+                if level_widget is not None:
+                    level_widget.update(self._level_group(items))
+                else:
+                    level_widget = Static(self._level_group(items), classes=_LEVEL_STYLES[level][2])
+                    self._level_widgets[level] = level_widget
+                    if previous is not None:
+                        scroll.mount(level_widget, after=previous)
+                    else:
+                        scroll.mount(level_widget, before=0)
+            
+            if level_widget is not None:
+                previous = level_widget
+    
+    def _required_fields(self, schema: Dict[str, Any]) -> FrozenSet[str]:
+        """Get a schema's required field names as a set."""
+        memo_schema, required_fields = self._required_memo
+        if memo_schema is not schema:
+            required_fields = frozenset(schema.get("required") or ())
+            self._required_memo = (schema, required_fields)
+        return required_fields
     
     def validate_field(self, field_name: str, value: Any, schema: Dict[str, Any]) -> List[ValidationItem]:
         """Validate a single field against its schema."""
         items = []
         field_schema = schema.get("properties", {}).get(field_name, {})
-        required_fields = schema.get("required", [])
+        required_fields = self._required_fields(schema)
         
         # Check required
         if field_name in required_fields and (value is None or value == ""):
-            items.append(ValidationItem(field_name, "This field is required", "error"))
+            items.append(_required_item(field_name))
             return items
         
         # Type validation
         field_type = field_schema.get("type")
-        if field_type and value is not None and value != "":
-            if field_type == "string":
-                if not isinstance(value, str):
-                    items.append(ValidationItem(field_name, "Must be a string", "error"))
-                
-                # Check enum values
-                if "enum" in field_schema and value not in field_schema["enum"]:
-                    items.append(ValidationItem(
-                        field_name, 
-                        f"Must be one of: {', '.join(field_schema['enum'])}", 
-                        "error"
-                    ))
-                
-                # Check string constraints
-                if "minLength" in field_schema and len(value) < field_schema["minLength"]:
-                    items.append(ValidationItem(
-                        field_name,
-                        f"Must be at least {field_schema['minLength']} characters",
-                        "error"
-                    ))
-                
-                if "maxLength" in field_schema and len(value) > field_schema["maxLength"]:
-                    items.append(ValidationItem(
-                        field_name,
-                        f"Must be at most {field_schema['maxLength']} characters",
-                        "error"
-                    ))
-                
-                # Pattern validation
-                if "pattern" in field_schema:
-                    import re
-                    pattern = field_schema["pattern"]
-                    if not re.match(pattern, value):
-                        items.append(ValidationItem(
-                            field_name,
-                            f"Does not match required pattern: {pattern}",
-                            "error"
-                        ))
-            
-            elif field_type == "integer":
-                try:
-                    int_value = int(value)
-                    
-                    # Check numeric constraints
-                    if "minimum" in field_schema and int_value < field_schema["minimum"]:
-                        items.append(ValidationItem(
-                            field_name,
-                            f"Must be at least {field_schema['minimum']}",
-                            "error"
-                        ))
-                    
-                    if "maximum" in field_schema and int_value > field_schema["maximum"]:
-                        items.append(ValidationItem(
-                            field_name,
-                            f"Must be at most {field_schema['maximum']}",
-                            "error"
-                        ))
-                except (ValueError, TypeError):
-                    items.append(ValidationItem(field_name, "Must be an integer", "error"))
-            
-            elif field_type == "number":
-                try:
-                    float_value = float(value)
-                    
-                    # Check numeric constraints
-                    if "minimum" in field_schema and float_value < field_schema["minimum"]:
-                        items.append(ValidationItem(
-                            field_name,
-                            f"Must be at least {field_schema['minimum']}",
-                            "error"
-                        ))
-                    
-                    if "maximum" in field_schema and float_value > field_schema["maximum"]:
-                        items.append(ValidationItem(
-                            field_name,
-                            f"Must be at most {field_schema['maximum']}",
-                            "error"
-                        ))
-                except (ValueError, TypeError):
-                    items.append(ValidationItem(field_name, "Must be a number", "error"))
-            
-            elif field_type == "boolean":
-                if not isinstance(value, bool):
-                    items.append(ValidationItem(field_name, "Must be true or false", "error"))
-            
-            elif field_type == "array":
-                if not isinstance(value, list):
-                    items.append(ValidationItem(field_name, "Must be an array", "error"))
-                else:
-                    # Check array constraints
-                    if "minItems" in field_schema and len(value) < field_schema["minItems"]:
-                        items.append(ValidationItem(
-                            field_name,
-                            f"Must have at least {field_schema['minItems']} items",
-                            "error"
-                        ))
-                    
-                    if "maxItems" in field_schema and len(value) > field_schema["maxItems"]:
-                        items.append(ValidationItem(
-                            field_name,
-                            f"Must have at most {field_schema['maxItems']} items",
-                            "error"
-                        ))
+        validator = _VALIDATORS.get(field_type) if isinstance(field_type, str) else None
+        if validator is not None and value is not None and value != "":
+            validator(field_name, value, field_schema, items)
         
         # Add warnings for best practices
         if field_name == "name" and value:
             if not value.replace("_", "").replace("-", "").isalnum():
                 items.append(ValidationItem(
                     field_name,
-                    "Consider using only letters, numbers, underscores, and hyphens",
+                    _MSG_NAME_CHARS,
                     "warning"
                 ))
         
@@ -286,10 +421,6 @@ class ValidationDisplay(Widget):
         required_fields = schema.get("required", [])
         for required_field in required_fields:
             if required_field not in data or data[required_field] is None or data[required_field] == "":
-                all_items.append(ValidationItem(
-                    required_field,
-                    "This field is required",
-                    "error"
-                ))
+                all_items.append(_required_item(required_field))
         
         self.update_validation(all_items)